@@ -27,7 +27,9 @@ from .functors.function import (  # noqa
     Function4,
     Provider,
 )
-from .streams.stream import stream, stream_of  # noqa
+from .streams.async_stream import async_stream, async_stream_of  # noqa
+from .streams.numeric_stream import stream_of_array  # noqa
+from .streams.stream import merge_sorted, stream, stream_of  # noqa
 
 pynction0 = Provider.decorator
 pynction1 = Function.decorator
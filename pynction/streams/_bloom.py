@@ -0,0 +1,70 @@
+import hashlib
+import math
+from typing import Any, Hashable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+def _encode(item: Hashable) -> bytes:
+    """
+    Stable encoding of `item`: ints (and integral floats), strings and bytes are
+    encoded by value so that different values never collide, any other item falls
+    back to its python hash.
+    """
+    if isinstance(item, float) and item.is_integer():
+        item = int(item)
+    if isinstance(item, int):
+        return b"i" + item.to_bytes(item.bit_length() // 8 + 1, "little", signed=True)
+    if isinstance(item, str):
+        return b"s" + item.encode("utf-8", "surrogatepass")
+    if isinstance(item, bytes):
+        return b"b" + item
+    return b"h" + hash(item).to_bytes(8, "little", signed=True)
+
+
+def check_parameters(capacity: int, error_rate: float) -> None:
+    if capacity < 1:
+        raise ValueError("capacity must be greater than 0")
+    if not 0 < error_rate < 1:
+        raise ValueError("error_rate must be between 0 and 1")
+
+
+class BloomFilter:
+    """
+    Probabilistic set backed by a bit array.
+    It never reports a false negative and reports false positives with
+    a probability close to `error_rate` while it holds at most `capacity` items.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        check_parameters(capacity, error_rate)
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: Hashable) -> Iterator[int]:
+        digest = hashlib.blake2b(_encode(item), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for index in range(self.hashes):
+            yield (first + index * second) % self.size
+
+    def add(self, item: Hashable) -> bool:
+        """
+        Adds `item` and returns True if it was (probably) already present.
+        """
+        bits = self._bits
+        present = True
+        for position in self._positions(item):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                present = False
+                bits[byte] |= mask
+        return present
+
+
+def distinct(elems: Iterator[T], key: Any, bloom: BloomFilter) -> Iterator[T]:
+    add = bloom.add
+    for elem in elems:
+        if not add(key(elem)):
+            yield elem
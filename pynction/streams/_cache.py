@@ -0,0 +1,69 @@
+from typing import Any, Iterable, Iterator, List, Optional
+
+from ._spill import BATCH_SIZE, SpillFile
+
+
+class Cache(Iterable[Any]):
+    """
+    Records the elements of `elems` the first time they are consumed so every
+    call to `iter` replays them from the beginning, evaluating the source only once.
+
+    The first `max_items` elements are kept in memory, the rest are spilled
+    to a temporary file in `spill_dir` in batches of `BATCH_SIZE` elements.
+    """
+
+    def __init__(
+        self,
+        elems: Iterator[Any],
+        max_items: int = None,
+        spill_dir: str = None,
+    ):
+        self._source = elems
+        self._exhausted = False
+        self._max_items = max_items
+        self._spill_dir = spill_dir
+        self._head: List[Any] = []
+        self._tail: List[Any] = []
+        self._spill: Optional[SpillFile] = None
+        self._spilled = 0
+
+    def __len__(self) -> int:
+        return len(self._head) + self._spilled + len(self._tail)
+
+    def _pull(self) -> bool:
+        if self._exhausted:
+            return False
+        for elem in self._source:
+            self._store(elem)
+            return True
+        self._exhausted = True
+        return False
+
+    def _store(self, elem: Any) -> None:
+        if self._max_items is None or len(self._head) < self._max_items:
+            self._head.append(elem)
+            return
+        self._tail.append(elem)
+        if len(self._tail) == BATCH_SIZE:
+            if self._spill is None:
+                self._spill = SpillFile(self._spill_dir)
+            self._spill.write(self._tail)
+            self._spilled += BATCH_SIZE
+            self._tail = []
+
+    def __iter__(self) -> Iterator[Any]:
+        index = 0
+        batch: List[Any] = []
+        batch_number = -1
+        while index < len(self) or self._pull():
+            if index < len(self._head):
+                yield self._head[index]
+            elif index - len(self._head) < self._spilled:
+                position = index - len(self._head)
+                if position // BATCH_SIZE != batch_number:
+                    batch_number = position // BATCH_SIZE
+                    batch = self._spill.read_batch(batch_number)  # type: ignore
+                yield batch[position % BATCH_SIZE]
+            else:
+                yield self._tail[index - len(self._head) - self._spilled]
+            index += 1
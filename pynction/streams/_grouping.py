@@ -0,0 +1,43 @@
+from typing import Any, Callable, Dict, Iterator, Tuple, TypeVar
+
+from .collectors import Collector
+
+T = TypeVar("T")
+K = TypeVar("K")
+R = TypeVar("R")
+
+
+def group_by(
+    elems: Iterator[T],
+    key: Callable[[T], K],
+    aggregator: Collector[T, Any, R],
+) -> Iterator[Tuple[K, R]]:
+    supplier, accumulator = aggregator.supplier, aggregator.accumulator
+    groups: Dict[K, Any] = {}
+    for elem in elems:
+        elem_key = key(elem)
+        current = groups[elem_key] if elem_key in groups else supplier()
+        groups[elem_key] = accumulator(current, elem)
+    for elem_key, accumulated in groups.items():
+        yield elem_key, aggregator.finisher(accumulated)
+
+
+def group_adjacent(
+    elems: Iterator[T],
+    key: Callable[[T], K],
+    aggregator: Collector[T, Any, R],
+) -> Iterator[Tuple[K, R]]:
+    accumulator = aggregator.accumulator
+    for elem in elems:
+        current_key = key(elem)
+        accumulated = accumulator(aggregator.supplier(), elem)
+        break
+    else:
+        return
+    for elem in elems:
+        elem_key = key(elem)
+        if elem_key != current_key:
+            yield current_key, aggregator.finisher(accumulated)
+            current_key, accumulated = elem_key, aggregator.supplier()
+        accumulated = accumulator(accumulated, elem)
+    yield current_key, aggregator.finisher(accumulated)
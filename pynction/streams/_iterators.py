@@ -0,0 +1,48 @@
+from itertools import islice
+from typing import Any, Callable, Iterator, List, Set, Tuple, TypeVar, cast
+
+T = TypeVar("T")
+
+_SEEKABLE_ITERATORS: Tuple[type, ...] = (
+    type(iter([])),
+    type(iter(())),
+    type(iter(range(0))),
+    type(iter(range(1 << 64))),
+)
+
+
+def chunks(elems: Iterator[T], size: int) -> Iterator[List[T]]:
+    """
+    Splits `elems` in lists of `size` elements, the last one may be shorter.
+    """
+    while True:
+        chunk = list(islice(elems, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def skip(elems: Iterator[T], n: int) -> Iterator[T]:
+    """
+    Discards the first `n` elements of `elems`.
+    List, tuple and range iterators are moved forward by index,
+    without iterating over the skipped elements.
+    """
+    if type(elems) in _SEEKABLE_ITERATORS:
+        state = cast(Any, elems).__reduce__()
+        if len(state) > 2:
+            cast(Any, elems).__setstate__(state[2] + n)
+        return elems
+    return islice(elems, n, None)
+
+
+def unique(elems: Iterator[T], key: Callable[[T], Any]) -> Iterator[T]:
+    """
+    Yields the elements whose `key` has not been seen before.
+    """
+    seen: Set[Any] = set()
+    for elem in elems:
+        elem_key = key(elem)
+        if elem_key not in seen:
+            seen.add(elem_key)
+            yield elem
@@ -0,0 +1,115 @@
+from collections import defaultdict
+from itertools import chain
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from pynction.monads.maybe import Maybe
+
+from ._spill import BATCH_SIZE, SpillFile
+
+T = TypeVar("T")
+S = TypeVar("S")
+
+INNER = "inner"
+LEFT = "left"
+
+Index = DefaultDict[Any, List[Any]]
+
+
+def _probe(
+    elems: Iterable[T],
+    index: Index,
+    key: Callable[[T], Any],
+    how: str,
+) -> Iterator[Tuple[T, Any]]:
+    for elem in elems:
+        matches = index.get(key(elem))
+        if matches:
+            for match in matches:
+                yield (elem, match) if how == INNER else (elem, Maybe.just(match))
+        elif how == LEFT:
+            yield elem, Maybe.nothing()
+
+
+def _partition(
+    elems: Iterable[T],
+    key: Callable[[T], Any],
+    partitions: int,
+    spill_dir: Optional[str],
+) -> List[SpillFile]:
+    spills = [SpillFile(spill_dir) for _ in range(partitions)]
+    buffers: List[List[T]] = [[] for _ in range(partitions)]
+    for elem in elems:
+        number = hash(key(elem)) % partitions
+        buffers[number].append(elem)
+        if len(buffers[number]) >= BATCH_SIZE:
+            spills[number].write(buffers[number])
+            buffers[number].clear()
+    for spill, buffer in zip(spills, buffers):
+        spill.write(buffer)
+    return spills
+
+
+def _grace_join(
+    left: Iterable[T],
+    right: Iterable[S],
+    left_key: Callable[[T], Any],
+    right_key: Callable[[S], Any],
+    how: str,
+    partitions: int,
+    spill_dir: Optional[str],
+) -> Iterator[Tuple[T, Any]]:
+    """
+    Both sides are partitioned by key to temporary files,
+    then each pair of partitions is joined in memory.
+    """
+    right_spills = _partition(right, right_key, partitions, spill_dir)
+    left_spills: List[SpillFile] = []
+    try:
+        left_spills = _partition(left, left_key, partitions, spill_dir)
+        for left_spill, right_spill in zip(left_spills, right_spills):
+            index: Index = defaultdict(list)
+            for elem in right_spill.read():
+                index[right_key(elem)].append(elem)
+            yield from _probe(left_spill.read(), index, left_key, how)
+    finally:
+        for spill in chain(left_spills, right_spills):
+            spill.close()
+
+
+def hash_join(
+    left: Iterator[T],
+    right: Iterable[S],
+    left_key: Callable[[T], Any],
+    right_key: Callable[[S], Any],
+    how: str,
+    memory_limit: int,
+    partitions: int,
+    spill_dir: str = None,
+) -> Iterator[Tuple[T, Any]]:
+    index: Index = defaultdict(list)
+    right_elems = iter(right)
+    for count, elem in enumerate(right_elems, 1):
+        index[right_key(elem)].append(elem)
+        if count > memory_limit:
+            in_memory = chain.from_iterable(index.values())
+            yield from _grace_join(
+                left,
+                chain(in_memory, right_elems),
+                left_key,
+                right_key,
+                how,
+                partitions,
+                spill_dir,
+            )
+            return
+    yield from _probe(left, index, left_key, how)
@@ -0,0 +1,190 @@
+import os
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from functools import partial
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Set,
+    TypeVar,
+)
+
+from ._iterators import chunks
+
+T = TypeVar("T")
+S = TypeVar("S")
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def map_chunk(f: Callable[[T], S], chunk: List[T]) -> List[S]:
+    return [f(elem) for elem in chunk]
+
+
+def _ordered_map(
+    executor: Executor,
+    f: Callable[[T], S],
+    elems: Iterable[T],
+    max_in_flight: int,
+) -> Generator[S, None, None]:
+    pending: Deque["Future[S]"] = deque()
+    try:
+        for elem in elems:
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+            pending.append(executor.submit(f, elem))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _completed_results(pending: Set["Future[S]"]) -> Iterator[S]:
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        pending.discard(future)
+        yield future.result()
+
+
+def _unordered_map(
+    executor: Executor,
+    f: Callable[[T], S],
+    elems: Iterable[T],
+    max_in_flight: int,
+) -> Generator[S, None, None]:
+    pending: Set["Future[S]"] = set()
+    try:
+        for elem in elems:
+            while len(pending) >= max_in_flight:
+                yield from _completed_results(pending)
+            pending.add(executor.submit(f, elem))
+        while pending:
+            yield from _completed_results(pending)
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def bounded_map(
+    executor: Executor,
+    f: Callable[[T], S],
+    elems: Iterable[T],
+    max_in_flight: int,
+    ordered: bool,
+) -> Generator[S, None, None]:
+    """
+    Submits `f(elem)` for each element to `executor` keeping at most
+    `max_in_flight` futures pending. Results are yielded in source order
+    when `ordered` is True, otherwise in completion order.
+
+    Pending futures are cancelled as soon as the consumer stops or a
+    result raises, so no work is left dangling behind the caller.
+    """
+    mapper = _ordered_map if ordered else _unordered_map
+    return mapper(executor, f, elems, max_in_flight)
+
+
+def par_map(
+    elems: Iterator[T],
+    f: Callable[[T], S],
+    workers: int,
+    chunksize: int,
+    ordered: bool,
+) -> Iterator[S]:
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = bounded_map(
+            executor,
+            partial(map_chunk, f),
+            chunks(elems, chunksize),
+            max_in_flight=workers * 2,
+            ordered=ordered,
+        )
+        try:
+            for chunk in results:
+                yield from chunk
+        finally:
+            results.close()
+
+
+def map_concurrent(
+    elems: Iterator[T],
+    f: Callable[[T], S],
+    max_workers: int,
+    max_in_flight: int,
+    ordered: bool,
+) -> Iterator[S]:
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = bounded_map(
+            executor,
+            f,
+            elems,
+            max_in_flight=max_in_flight,
+            ordered=ordered,
+        )
+        try:
+            yield from results
+        finally:
+            results.close()
+
+
+def combine_chunk(
+    key: Callable[[T], K],
+    mapper: Callable[[T], V],
+    combiner: Callable[[V, V], V],
+    chunk: List[T],
+) -> Dict[K, V]:
+    combined: Dict[K, V] = {}
+    for elem in chunk:
+        elem_key, value = key(elem), mapper(elem)
+        combined[elem_key] = (
+            combiner(combined[elem_key], value) if elem_key in combined else value
+        )
+    return combined
+
+
+def par_reduce(
+    elems: Iterator[T],
+    key: Callable[[T], K],
+    mapper: Callable[[T], V],
+    combiner: Callable[[V, V], V],
+    reducer: Callable[[V, V], V],
+    workers: int,
+    chunksize: int,
+) -> Dict[K, V]:
+    reduced: Dict[K, V] = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        partial_results = bounded_map(
+            executor,
+            partial(combine_chunk, key, mapper, combiner),
+            chunks(elems, chunksize),
+            max_in_flight=workers * 2,
+            ordered=True,
+        )
+        try:
+            for combined in partial_results:
+                for elem_key, value in combined.items():
+                    reduced[elem_key] = (
+                        reducer(reduced[elem_key], value)
+                        if elem_key in reduced
+                        else value
+                    )
+        finally:
+            partial_results.close()
+    return reduced
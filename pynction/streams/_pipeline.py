@@ -0,0 +1,53 @@
+from itertools import chain, takewhile
+from typing import Any, Callable, Dict, Iterator, NamedTuple
+
+MAP = "map"
+FILTER = "filter"
+FLAT_MAP = "flat_map"
+TAKE_WHILE = "take_while"
+PIPE = "pipe"
+
+
+class Stage(NamedTuple):
+    """
+    A recorded `Stream` operation.
+
+    `map`, `filter`, `flat_map` and `take_while` stages receive the element,
+    `pipe` stages receive the whole upstream iterator and return a new one.
+    """
+
+    kind: str
+    fn: Callable[..., Any]
+    name: str = ""
+
+    @property
+    def description(self) -> str:
+        if self.kind == PIPE:
+            return self.name or PIPE
+        return f"{self.kind}({getattr(self.fn, '__name__', repr(self.fn))})"
+
+
+def _flat_map(f: Callable[[Any], Any], elems: Iterator[Any]) -> Iterator[Any]:
+    return chain.from_iterable(map(f, elems))
+
+
+def _pipe(f: Callable[[Iterator[Any]], Any], elems: Iterator[Any]) -> Iterator[Any]:
+    return iter(f(elems))
+
+
+_APPLY: Dict[str, Callable[[Any, Iterator[Any]], Iterator[Any]]] = {
+    MAP: map,
+    FILTER: filter,
+    FLAT_MAP: _flat_map,
+    TAKE_WHILE: takewhile,
+    PIPE: _pipe,
+}
+
+
+def apply(stage: Stage, elems: Iterator[Any]) -> Iterator[Any]:
+    """
+    Chains `stage` after `elems`. Element-wise stages use the builtin
+    `map`, `filter`, `takewhile` and `chain` iterators, so no python
+    frame is executed per element apart from the stage callables.
+    """
+    return _APPLY[stage.kind](stage.fn, elems)
@@ -0,0 +1,84 @@
+import queue
+import threading
+from typing import Any, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_DONE: Any = object()
+_POLL_INTERVAL = 0.1
+
+
+class _Failure:
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+class _Producer(threading.Thread):
+    """
+    Moves `elems` into `buffer` until they are exhausted or `stop` is set.
+    """
+
+    def __init__(self, elems: Iterator[Any], buffer: "queue.Queue[Any]"):
+        super().__init__(name="pynction-prefetch", daemon=True)
+        self.elems = elems
+        self.buffer = buffer
+        self.stop = threading.Event()
+
+    def run(self) -> None:
+        try:
+            self._produce()
+        except Exception as error:
+            self._put(_Failure(error))
+        finally:
+            close = getattr(self.elems, "close", None)
+            if close is not None:
+                close()
+
+    def _produce(self) -> None:
+        for elem in self.elems:
+            if not self._put(elem):
+                return
+        self._put(_DONE)
+
+    def _put(self, item: Any) -> bool:
+        while not self.stop.is_set():
+            try:
+                self.buffer.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
+def _get(producer: _Producer) -> Any:
+    while True:
+        alive = producer.is_alive()
+        try:
+            return producer.buffer.get(timeout=_POLL_INTERVAL)
+        except queue.Empty:
+            if not alive:
+                raise RuntimeError("prefetch producer stopped unexpectedly") from None
+
+
+def prefetch(elems: Iterator[T], size: int) -> Iterator[T]:
+    """
+    Consumes `elems` in a background thread keeping up to `size` elements ready.
+
+    When the consumer stops early, the producer thread is signaled to stop,
+    closes `elems` and is joined before returning. Errors raised by `elems`
+    are raised again in the consumer thread, and a `RuntimeError` is raised
+    if the producer dies without reporting one.
+    """
+    producer = _Producer(elems, queue.Queue(maxsize=size))
+    producer.start()
+    try:
+        while True:
+            item = _get(producer)
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        producer.stop.set()
+        producer.join()
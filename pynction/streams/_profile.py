@@ -0,0 +1,142 @@
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+from . import _pipeline
+from ._pipeline import Stage
+
+
+@dataclass
+class StageStats:
+    """
+    Statistics of a single `Stream` stage collected while profiling.
+
+    For `map`, `filter`, `flat_map` and `take_while`, `time` is the time spent in the callback.
+    For the rest of the stages it also includes the time spent in the previous stages
+    while they produce the elements this stage consumes.
+    """
+
+    description: str
+    elements_in: int = 0
+    elements_out: int = 0
+    time: float = 0.0
+
+    @property
+    def selectivity(self) -> float:
+        return self.elements_out / self.elements_in if self.elements_in else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"in={self.elements_in} out={self.elements_out} "
+            f"selectivity={self.selectivity:.2%} time={self.time:.6f}s"
+        )
+
+    def __str__(self) -> str:
+        return f"{self.description}: {self.summary()}"
+
+
+def _timed_output(stats: StageStats, elems: Iterator[Any]) -> Iterator[Any]:
+    while True:
+        start = perf_counter()
+        try:
+            elem = next(elems)
+        except StopIteration:
+            stats.time += perf_counter() - start
+            return
+        stats.time += perf_counter() - start
+        stats.elements_out += 1
+        yield elem
+
+
+def _counted_input(stats: StageStats, elems: Iterable[Any]) -> Iterator[Any]:
+    for elem in elems:
+        stats.elements_in += 1
+        yield elem
+
+
+Wrapper = Callable[..., Any]
+
+
+def _timed_call(fn: Wrapper, stats: StageStats, elem: Any) -> Any:
+    stats.elements_in += 1
+    start = perf_counter()
+    result = fn(elem)
+    stats.time += perf_counter() - start
+    return result
+
+
+def _mapped(fn: Wrapper, stats: StageStats) -> Wrapper:
+    def mapped(elem: Any) -> Any:
+        result = _timed_call(fn, stats, elem)
+        stats.elements_out += 1
+        return result
+
+    return mapped
+
+
+def _expanded(fn: Wrapper, stats: StageStats) -> Wrapper:
+    def expanded(elem: Any) -> Iterator[Any]:
+        return _timed_output(stats, iter(_timed_call(fn, stats, elem)))
+
+    return expanded
+
+
+def _checked(fn: Wrapper, stats: StageStats) -> Wrapper:
+    def checked(elem: Any) -> Any:
+        satisfies = _timed_call(fn, stats, elem)
+        if satisfies:
+            stats.elements_out += 1
+        return satisfies
+
+    return checked
+
+
+def _piped(fn: Wrapper, stats: StageStats) -> Wrapper:
+    def piped(elems: Iterator[Any]) -> Iterator[Any]:
+        return _timed_output(stats, iter(fn(_counted_input(stats, elems))))
+
+    return piped
+
+
+_WRAPPERS: Dict[str, Callable[[Wrapper, StageStats], Wrapper]] = {
+    _pipeline.MAP: _mapped,
+    _pipeline.FILTER: _checked,
+    _pipeline.FLAT_MAP: _expanded,
+    _pipeline.TAKE_WHILE: _checked,
+    _pipeline.PIPE: _piped,
+}
+
+
+def _instrument(stage: Stage, stats: StageStats) -> Stage:
+    return stage._replace(fn=_WRAPPERS[stage.kind](stage.fn, stats))
+
+
+class StreamProfile:
+    """
+    Per-stage statistics of a profiled `Stream`, available after its terminal operation.
+    """
+
+    def __init__(self, stages: Tuple[Stage, ...]):
+        self.stages = [StageStats(stage.description) for stage in stages]
+        self._instrumented = tuple(
+            _instrument(stage, stats) for stage, stats in zip(stages, self.stages)
+        )
+
+    def instrumented(self) -> Tuple[Stage, ...]:
+        return self._instrumented
+
+    def __str__(self) -> str:
+        return "\n".join(str(stats) for stats in self.stages)
+
+
+def explain(
+    source: Iterable[Any],
+    stages: Tuple[Stage, ...],
+    profile: StreamProfile = None,
+) -> str:
+    lines = [f"source: {type(source).__name__}"]
+    stats: List[Any] = list(profile.stages) if profile else [None] * len(stages)
+    for stage, stage_stats in zip(stages, stats):
+        details = f" {stage_stats.summary()}" if stage_stats else ""
+        lines.append(f"  -> {stage.description}{details}")
+    return "\n".join(lines)
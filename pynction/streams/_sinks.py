@@ -0,0 +1,83 @@
+import csv
+import gzip
+import io
+import json
+from typing import IO, Any, Callable, Iterable, Iterator, Mapping, Optional, Sequence
+
+from ._sources import PathLike
+
+DEFAULT_BUFFER_SIZE = 1 << 20
+
+
+def open_binary(
+    path: PathLike,
+    compress: Optional[bool],
+    buffer_size: int,
+) -> IO[bytes]:
+    """
+    Opens `path` for writing with a buffer of `buffer_size` bytes, so the file
+    (or the gzip compressor) receives a few big writes instead of one per element.
+    When `compress` is None the file is compressed if `path` ends with `.gz`.
+    """
+    if str(path).endswith(".gz") if compress is None else compress:
+        return io.BufferedWriter(gzip.open(path, "wb"), buffer_size)  # type: ignore
+    return open(path, "wb", buffering=buffer_size)
+
+
+def write_lines(
+    path: PathLike,
+    elems: Iterable[Any],
+    to_text: Callable[[Any], str],
+    encoding: str,
+    compress: Optional[bool],
+    buffer_size: int,
+) -> int:
+    newline = "\n".encode(encoding)
+    count = 0
+    with open_binary(path, compress, buffer_size) as file:
+        write = file.write
+        for elem in elems:
+            if isinstance(elem, (bytes, bytearray, memoryview)):
+                write(elem)
+            else:
+                write(to_text(elem).encode(encoding))
+            write(newline)
+            count += 1
+    return count
+
+
+def to_json(elem: Any) -> str:
+    return json.dumps(elem, ensure_ascii=False)
+
+
+def write_csv(
+    path: PathLike,
+    elems: Iterator[Any],
+    header: Optional[Sequence[str]],
+    encoding: str,
+    compress: Optional[bool],
+    buffer_size: int,
+) -> int:
+    with io.TextIOWrapper(
+        open_binary(path, compress, buffer_size),
+        encoding=encoding,
+        newline="",
+    ) as file:
+        first = next(elems, None)
+        if first is None:
+            if header:
+                csv.writer(file).writerow(header)
+            return 0
+        if isinstance(first, Mapping):
+            writer: Any = csv.DictWriter(file, fieldnames=header or list(first.keys()))
+            writer.writeheader()
+        else:
+            writer = csv.writer(file)
+            if header:
+                writer.writerow(header)
+        writer.writerow(first)
+        count = 1
+        for row in elems:
+            writer.writerow(row)
+            count += 1
+        return count
@@ -0,0 +1,49 @@
+import heapq
+from itertools import islice
+from typing import Any, Callable, Iterator, List, Optional, TypeVar
+
+from ._spill import SpillFile
+
+T = TypeVar("T")
+
+_END: Any = object()
+
+
+def external_sort(
+    elems: Iterator[T],
+    key: Optional[Callable[[T], Any]],
+    reverse: bool,
+    memory_limit: int,
+    spill_dir: str = None,
+) -> Iterator[T]:
+    """
+    Sorts runs of at most `memory_limit` elements in memory, spills every full run
+    followed by more elements to a temporary file and lazily merges them with
+    the last run. When the input fits in a single run nothing is spilled.
+    """
+    spilled: List[SpillFile] = []
+    head: List[T] = []
+    try:
+        while True:
+            run = head + list(islice(elems, memory_limit - len(head)))
+            run.sort(key=key, reverse=reverse)
+            following = next(elems, _END)
+            if following is _END:
+                break
+            spill = SpillFile(spill_dir)
+            spilled.append(spill)
+            spill.write(run)
+            run.clear()
+            head = [following]
+        if not spilled:
+            yield from run
+            return
+        yield from heapq.merge(
+            *(spill.read() for spill in spilled),
+            run,
+            key=key,
+            reverse=reverse,
+        )
+    finally:
+        for spill in spilled:
+            spill.close()
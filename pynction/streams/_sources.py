@@ -0,0 +1,366 @@
+import bz2
+import csv
+import gzip
+import io
+import json
+import lzma
+import mmap
+import os
+import socket
+import struct
+from functools import partial
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from ._parallel import par_map
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+DEFAULT_READ_SIZE = 1 << 20
+DEFAULT_CHUNK_BYTES = 4 << 20
+
+
+def _close_mmap(mapped: mmap.mmap) -> None:
+    try:
+        mapped.close()
+    except BufferError:
+        # The consumer still holds views over the mapping,
+        # it is unmapped once the last of them is garbage collected.
+        pass
+
+
+def _view_lines(
+    view: memoryview,
+    data: Union[bytes, mmap.mmap],
+    start: int,
+    end: int,
+) -> Iterator[memoryview]:
+    while start < end:
+        newline = data.find(b"\n", start, end)
+        if newline == -1:
+            yield view[start:end]
+            return
+        yield view[start:newline]
+        start = newline + 1
+
+
+def mmap_blocks(path: PathLike, read_size: int) -> Iterator[memoryview]:
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if not size:
+            return
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        with memoryview(mapped) as view:
+            for start in range(0, size, read_size):
+                yield view[start : start + read_size]
+    finally:
+        _close_mmap(mapped)
+
+
+def mmap_lines(path: PathLike) -> Iterator[memoryview]:
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if not size:
+            return
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        yield from _view_lines(memoryview(mapped), mapped, 0, size)
+    finally:
+        _close_mmap(mapped)
+
+
+def read_blocks(file: BinaryIO, read_size: int) -> Iterator[bytes]:
+    while True:
+        block = file.read(read_size)
+        if not block:
+            return
+        yield block
+
+
+def file_blocks(path: PathLike, read_size: int) -> Iterator[memoryview]:
+    with open(path, "rb", buffering=0) as file:
+        for block in read_blocks(file, read_size):
+            yield memoryview(block)
+
+
+def block_lines(blocks: Iterator[bytes]) -> Iterator[memoryview]:
+    """
+    Splits a sequence of blocks in lines without the trailing newline.
+    Only the incomplete line at the end of each block is copied.
+    """
+    remainder = b""
+    for block in blocks:
+        data = remainder + block if remainder else block
+        last_newline = data.rfind(b"\n")
+        if last_newline == -1:
+            remainder = data
+            continue
+        yield from _view_lines(memoryview(data), data, 0, last_newline + 1)
+        remainder = data[last_newline + 1 :]
+    if remainder:
+        yield memoryview(remainder)
+
+
+def file_lines(path: PathLike, read_size: int) -> Iterator[memoryview]:
+    with open(path, "rb", buffering=0) as file:
+        yield from block_lines(read_blocks(file, read_size))
+
+
+def byte_ranges(
+    path: PathLike,
+    chunk_bytes: int,
+    start: int = 0,
+) -> Iterator[Tuple[int, int]]:
+    """
+    Splits the file at `path` (from byte `start`) in ranges of about `chunk_bytes` bytes
+    that always end right after a newline, so every range contains complete lines.
+    """
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        while start < size:
+            file.seek(start + chunk_bytes)
+            file.readline()
+            end = min(file.tell(), size)
+            yield start, end
+            start = end
+
+
+def read_range(path: PathLike, byte_range: Tuple[int, int]) -> bytes:
+    start, end = byte_range
+    with open(path, "rb") as file:
+        file.seek(start)
+        return file.read(end - start)
+
+
+def parse_jsonl_range(
+    path: PathLike,
+    encoding: str,
+    byte_range: Tuple[int, int],
+) -> List[Any]:
+    lines = read_range(path, byte_range).decode(encoding).split("\n")
+    return [json.loads(line) for line in lines if line.strip()]
+
+
+def parse_csv_range(
+    path: PathLike,
+    encoding: str,
+    header: Optional[List[str]],
+    fmtparams: Dict[str, Any],
+    byte_range: Tuple[int, int],
+) -> List[Any]:
+    lines = io.StringIO(read_range(path, byte_range).decode(encoding), newline="")
+    if header is None:
+        return list(csv.reader(lines, **fmtparams))
+    return list(csv.DictReader(lines, fieldnames=header, **fmtparams))
+
+
+def csv_header(
+    path: PathLike,
+    encoding: str,
+    fmtparams: Dict[str, Any],
+) -> Tuple[List[str], int]:
+    with open(path, "rb") as file:
+        first_line = file.readline()
+    header: List[str] = next(csv.reader([first_line.decode(encoding)], **fmtparams), [])
+    return header, len(first_line)
+
+
+def parallel_parse(
+    path: PathLike,
+    parse_range: Callable[[Tuple[int, int]], List[Any]],
+    start: int,
+    chunk_bytes: int,
+    workers: int,
+) -> Iterator[Any]:
+    ranges = byte_ranges(path, chunk_bytes, start)
+    if workers == 1:
+        parsed: Iterator[List[Any]] = map(parse_range, ranges)
+    else:
+        parsed = par_map(
+            ranges,
+            parse_range,
+            workers=workers,
+            chunksize=1,
+            ordered=True,
+        )
+    for records in parsed:
+        yield from records
+
+
+def jsonl_records(
+    path: PathLike,
+    encoding: str,
+    chunk_bytes: int,
+    workers: int,
+) -> Iterator[Any]:
+    yield from parallel_parse(
+        path,
+        partial(parse_jsonl_range, path, encoding),
+        0,
+        chunk_bytes,
+        workers,
+    )
+
+
+def csv_records(
+    path: PathLike,
+    has_header: bool,
+    encoding: str,
+    chunk_bytes: int,
+    workers: int,
+    fmtparams: Dict[str, Any],
+) -> Iterator[Any]:
+    header, start = csv_header(path, encoding, fmtparams) if has_header else (None, 0)
+    parse_range = partial(parse_csv_range, path, encoding, header, fmtparams)
+    yield from parallel_parse(path, parse_range, start, chunk_bytes, workers)
+
+
+_MAGIC_NUMBERS = (
+    (b"\x1f\x8b", gzip.open),
+    (b"BZh", bz2.open),
+    (b"\xfd7zXZ\x00", lzma.open),
+)
+_SUFFIXES = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open, ".lzma": lzma.open}
+
+
+def open_compressed(path: PathLike) -> BinaryIO:
+    """
+    Opens `path` for reading, decompressing it if it is a gzip, bz2 or xz/lzma file.
+    The codec is detected by the first bytes of the file, or by its extension.
+    """
+    with open(path, "rb") as file:
+        header = file.read(6)
+    for magic_number, opener in _MAGIC_NUMBERS:
+        if header.startswith(magic_number):
+            return opener(path, "rb")  # type: ignore
+    suffix_opener = _SUFFIXES.get(os.path.splitext(str(path))[1].lower())
+    return suffix_opener(path, "rb") if suffix_opener else open(path, "rb")  # type: ignore
+
+
+def compressed_blocks(path: PathLike, read_size: int) -> Iterator[bytes]:
+    with open_compressed(path) as file:
+        yield from read_blocks(file, read_size)
+
+
+def unpack_records(
+    view: memoryview,
+    record_struct: struct.Struct,
+    block_records: int,
+) -> Iterator[Tuple[Any, ...]]:
+    """
+    Unpacks consecutive records from `view` with `struct.iter_unpack`, working over
+    slices of `block_records` records so no intermediate `bytes` are created.
+    """
+    if len(view) % record_struct.size:
+        raise ValueError(
+            f"Buffer size {len(view)} is not a multiple of the record size {record_struct.size}",
+        )
+    block_size = record_struct.size * block_records
+    for start in range(0, len(view), block_size):
+        yield from record_struct.iter_unpack(view[start : start + block_size])
+
+
+def buffer_records(
+    buffer: Any,
+    record_struct: struct.Struct,
+    block_records: int,
+) -> Iterator[Tuple[Any, ...]]:
+    with memoryview(buffer) as view, view.cast("B") as data:
+        yield from unpack_records(data, record_struct, block_records)
+
+
+def mmap_records(
+    path: PathLike,
+    record_struct: struct.Struct,
+    block_records: int,
+) -> Iterator[Tuple[Any, ...]]:
+    with open(path, "rb") as file:
+        if not os.fstat(file.fileno()).st_size:
+            return
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    with mapped:
+        yield from buffer_records(mapped, record_struct, block_records)
+
+
+def _check_frame_size(length: int, max_frame_size: int) -> None:
+    if length > max_frame_size:
+        raise ValueError(
+            f"Frame of {length} bytes exceeds max_frame_size {max_frame_size}",
+        )
+
+
+class FrameReader:
+    """
+    Reads frames from a socket with `recv_into` over a single reusable `bytearray`.
+    Frames are returned as `memoryview`s over that buffer, so each one is only valid
+    until the next frame is requested.
+    """
+
+    def __init__(self, sock: socket.socket, buffer_size: int):
+        self._sock = sock
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._start = 0
+        self._end = 0
+
+    def _compact(self, needed: int) -> None:
+        pending = self._end - self._start
+        if needed > len(self._buffer):
+            buffer = bytearray(max(needed, 2 * len(self._buffer)))
+            buffer[:pending] = self._view[self._start : self._end]
+            self._buffer, self._view = buffer, memoryview(buffer)
+        else:
+            self._buffer[:pending] = bytes(self._view[self._start : self._end])
+        self._start, self._end = 0, pending
+
+    def _fill(self, needed: int) -> bool:
+        """
+        Receives data until there are `needed` bytes pending to be read.
+        Returns False if the connection is closed before that.
+        """
+        while self._end - self._start < needed:
+            if self._start + needed > len(self._buffer):
+                self._compact(needed)
+            received = self._sock.recv_into(self._view[self._end :])
+            if not received:
+                return False
+            self._end += received
+        return True
+
+    def _incomplete(self) -> ConnectionError:
+        return ConnectionError(
+            f"Connection closed with an incomplete frame of {self._end - self._start} bytes",
+        )
+
+    def length_prefixed(
+        self,
+        prefix: struct.Struct,
+        max_frame_size: int,
+    ) -> Iterator[memoryview]:
+        while self._fill(prefix.size):
+            (length,) = prefix.unpack_from(self._buffer, self._start)
+            _check_frame_size(length, max_frame_size)
+            if not self._fill(prefix.size + length):
+                raise self._incomplete()
+            frame_start = self._start + prefix.size
+            self._start = frame_start + length
+            yield self._view[frame_start : self._start]
+        if self._end > self._start:
+            raise self._incomplete()
+
+    def newline_delimited(self, max_frame_size: int) -> Iterator[memoryview]:
+        scanned = 0
+        while True:
+            newline = self._buffer.find(b"\n", self._start + scanned, self._end)
+            frame_end = self._end if newline == -1 else newline
+            _check_frame_size(frame_end - self._start, max_frame_size)
+            if newline != -1:
+                frame_start, self._start, scanned = self._start, newline + 1, 0
+                yield self._view[frame_start:newline]
+                continue
+            scanned = self._end - self._start
+            if not self._fill(scanned + 1):
+                break
+        if self._end > self._start:
+            frame_start, self._start = self._start, self._end
+            yield self._view[frame_start : self._end]
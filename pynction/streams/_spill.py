@@ -0,0 +1,44 @@
+import pickle  # noqa: S403 - only reads back what this process wrote
+import tempfile
+from typing import IO, Any, Iterable, Iterator, List
+
+from ._iterators import chunks
+
+BATCH_SIZE = 1024
+
+
+class SpillFile:
+    """
+    Temporary file used to move elements out of memory.
+    Elements are pickled in batches and the file is deleted when closed.
+    """
+
+    def __init__(self, directory: str = None):
+        self._file: IO[bytes] = tempfile.TemporaryFile(dir=directory)
+        self._offsets: List[int] = []
+        self.size = 0
+
+    def write(self, elems: Iterable[Any]) -> None:
+        for batch in chunks(iter(elems), BATCH_SIZE):
+            self._file.seek(0, 2)
+            self._offsets.append(self._file.tell())
+            pickle.dump(batch, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+            self.size += len(batch)
+
+    def read_batch(self, number: int) -> List[Any]:
+        """
+        Reads the `number`-th batch written. Every write of `BATCH_SIZE` elements
+        or less produces exactly one batch.
+        """
+        self._file.seek(self._offsets[number])
+        return pickle.load(self._file)  # noqa: S301
+
+    def read(self) -> Iterator[Any]:
+        """
+        Reads the elements back in the order they were written.
+        """
+        for number in range(len(self._offsets)):
+            yield from self.read_batch(number)
+
+    def close(self) -> None:
+        self._file.close()
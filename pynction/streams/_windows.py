@@ -0,0 +1,60 @@
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Deque, Iterator, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def sliding(elems: Iterator[T], size: int, step: int) -> Iterator[Tuple[T, ...]]:
+    window: Deque[T] = deque(maxlen=size)
+    for count, elem in enumerate(elems, 1):
+        window.append(elem)
+        if count >= size and (count - size) % step == 0:
+            yield tuple(window)
+
+
+def tumbling(elems: Iterator[T], size: int) -> Iterator[Tuple[T, ...]]:
+    while True:
+        window = tuple(islice(elems, size))
+        if not window:
+            return
+        yield window
+
+
+def tumbling_time(
+    elems: Iterator[T],
+    duration: Any,
+    timestamp: Callable[[T], Any],
+) -> Iterator[Tuple[T, ...]]:
+    """
+    Windows start at the time of the first element, so `timestamp` and `duration`
+    only need to support subtraction and floor division (numbers or `datetime`/`timedelta`).
+    """
+    window: Deque[T] = deque()
+    origin = current_bucket = None
+    for elem in elems:
+        now = timestamp(elem)
+        if origin is None:
+            origin = now
+        bucket = (now - origin) // duration
+        if window and bucket != current_bucket:
+            yield tuple(window)
+            window.clear()
+        current_bucket = bucket
+        window.append(elem)
+    if window:
+        yield tuple(window)
+
+
+def sliding_time(
+    elems: Iterator[T],
+    duration: Any,
+    timestamp: Callable[[T], Any],
+) -> Iterator[Tuple[T, ...]]:
+    window: Deque[Tuple[Any, T]] = deque()
+    for elem in elems:
+        now = timestamp(elem)
+        while window and window[0][0] <= now - duration:
+            window.popleft()
+        window.append((now, elem))
+        yield tuple(elem for _, elem in window)
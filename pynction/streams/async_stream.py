@@ -0,0 +1,254 @@
+import asyncio
+import inspect
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Iterable,
+    List,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
+
+T = TypeVar("T")
+S = TypeVar("S")
+
+MaybeAwaitable = Union[S, Awaitable[S]]
+
+
+async def _call(f: Callable[[T], MaybeAwaitable[S]], elem: T) -> S:
+    result = f(elem)
+    if inspect.isawaitable(result):
+        return await result
+    return result  # type: ignore
+
+
+async def _iterate(elems: Union[Iterable[T], AsyncIterable[T]]) -> AsyncIterator[T]:
+    if isinstance(elems, AsyncIterable):
+        async for elem in elems:
+            yield elem
+    else:
+        for elem in elems:
+            yield elem
+
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError("concurrency must be greater than 0")
+
+
+async def _bounded_map(
+    elems: AsyncIterator[T],
+    f: Callable[[T], Any],
+    concurrency: int,
+) -> AsyncIterator[Any]:
+    """
+    Applies `f` to each element keeping up to `concurrency` calls running
+    at the same time, yielding the results in source order.
+    """
+    pending: Deque["asyncio.Future[Any]"] = deque()
+    try:
+        async for elem in elems:
+            if len(pending) >= concurrency:
+                yield await pending.popleft()
+            pending.append(asyncio.ensure_future(_call(f, elem)))
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+class AsyncStream(AsyncIterable[T]):
+    """
+    `AsyncStream` is the asyncio counterpart of `Stream`.
+    It wraps sync or async iterables and its operations accept
+    both plain functions and coroutine functions.
+
+    Each stage can run up to `concurrency` awaits at the same time,
+    results are always returned in the original order.
+    It operates in a "lazy" way to avoid any memory overhead.
+    """
+
+    _elems: AsyncIterator[T]
+
+    def __init__(
+        self,
+        elems: Union[Iterable[T], AsyncIterable[T]],
+    ):
+        self._elems = _iterate(elems)
+
+    @overload
+    def map(
+        self,
+        f: Callable[[T], Awaitable[S]],
+        concurrency: int = 1,
+    ) -> "AsyncStream[S]":
+        ...
+
+    @overload
+    def map(self, f: Callable[[T], S], concurrency: int = 1) -> "AsyncStream[S]":
+        ...
+
+    def map(
+        self,
+        f: Callable[[T], MaybeAwaitable[S]],
+        concurrency: int = 1,
+    ) -> "AsyncStream[S]":
+        """
+        Applies the `f` function on each value and returns the result `AsyncStream`.
+        `f` can be a plain function or a coroutine function.
+
+        Example:
+        ```
+        await async_stream_of(user_ids).map(fetch_user, concurrency=10).to_list()
+        ```
+        """
+        _check_concurrency(concurrency)
+        return AsyncStream(_bounded_map(self._elems, f, concurrency))
+
+    @overload
+    def filter(
+        self,
+        satisfy_condition: Callable[[T], Awaitable[bool]],
+        concurrency: int = 1,
+    ) -> "AsyncStream[T]":
+        ...
+
+    @overload
+    def filter(
+        self,
+        satisfy_condition: Callable[[T], bool],
+        concurrency: int = 1,
+    ) -> "AsyncStream[T]":
+        ...
+
+    def filter(
+        self,
+        satisfy_condition: Callable[[T], MaybeAwaitable[bool]],
+        concurrency: int = 1,
+    ) -> "AsyncStream[T]":
+        """
+        Applies `satisfy_condition` over each value and returns a new
+        `AsyncStream` with values that have satisfied the condition.
+
+        Example
+        ```
+        await async_stream(1, 2, 3, 4).filter(lambda a: a < 3).to_list()  # Returns [1, 2]
+        ```
+        """
+        _check_concurrency(concurrency)
+
+        async def evaluate(elem: T) -> Tuple[T, bool]:
+            return elem, await _call(satisfy_condition, elem)
+
+        async def satisfied() -> AsyncIterator[T]:
+            async for elem, satisfies in _bounded_map(
+                self._elems,
+                evaluate,
+                concurrency,
+            ):
+                if satisfies:
+                    yield elem
+
+        return AsyncStream(satisfied())
+
+    @overload
+    def flat_map(
+        self,
+        f: Callable[[T], Awaitable[Union[Iterable[S], AsyncIterable[S]]]],
+        concurrency: int = 1,
+    ) -> "AsyncStream[S]":
+        ...
+
+    @overload
+    def flat_map(
+        self,
+        f: Callable[[T], Union[Iterable[S], AsyncIterable[S]]],
+        concurrency: int = 1,
+    ) -> "AsyncStream[S]":
+        ...
+
+    def flat_map(
+        self,
+        f: Callable[[T], MaybeAwaitable[Union[Iterable[S], AsyncIterable[S]]]],
+        concurrency: int = 1,
+    ) -> "AsyncStream[S]":
+        """
+        Applies the `f` function on each value
+        and then flattens the global result into a single `AsyncStream` of elements.
+        `f` can return sync or async iterables.
+
+        Example
+        ```
+        await async_stream(1, 2).flat_map(lambda a: [a, a]).to_list()  # Returns [1, 1, 2, 2]
+        ```
+        """
+        _check_concurrency(concurrency)
+
+        async def all_elems() -> AsyncIterator[S]:
+            async for new_elems in _bounded_map(self._elems, f, concurrency):
+                async for new_elem in _iterate(new_elems):
+                    yield new_elem
+
+        return AsyncStream(all_elems())
+
+    def take_while(
+        self,
+        satisfy_condition: Callable[[T], MaybeAwaitable[bool]],
+    ) -> "AsyncStream[T]":
+        """
+        Takes the first N elements of `AsyncStream` while each element evaluate `satisfy_condition` as True
+        """
+
+        async def take() -> AsyncIterator[T]:
+            async for elem in self._elems:
+                if not await _call(satisfy_condition, elem):
+                    return
+                yield elem
+
+        return AsyncStream(take())
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self._elems
+
+    async def to_list(self) -> List[T]:
+        return [elem async for elem in self._elems]
+
+    async def to_set(self) -> Set[T]:
+        return {elem async for elem in self._elems}
+
+
+def async_stream(*args: T) -> AsyncStream[T]:
+    """
+    Factory method for `AsyncStream` class.
+    This method takes N number of arguments and creates
+    an `AsyncStream` of them.
+
+    Example
+    ```
+    async_stream(1, 2, 3, 4)  # Returns AsyncStream[int]
+    ```
+    """
+    return AsyncStream(args)
+
+
+def async_stream_of(elems: Union[Iterable[T], AsyncIterable[T]]) -> AsyncStream[T]:
+    """
+    Factory method for `AsyncStream` class.
+    This method takes a sync or async iterable and creates an `AsyncStream` of it.
+
+    Example
+    ```
+    async_stream_of([1, 2, 3, 4])  # Returns AsyncStream[int]
+    async_stream_of(async_generator())  # Returns AsyncStream[...]
+    ```
+    """
+    return AsyncStream(elems)
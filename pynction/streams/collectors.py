@@ -0,0 +1,234 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, List, Tuple, TypeVar
+
+from pynction.monads.maybe import Maybe
+
+T = TypeVar("T")
+S = TypeVar("S")
+A = TypeVar("A")
+R = TypeVar("R")
+K = TypeVar("K")
+V = TypeVar("V")
+
+_EMPTY: Any = object()
+
+
+@dataclass(frozen=True)
+class Collector(Generic[T, A, R]):
+    """
+    A `Collector` describes an aggregation that is computed incrementally,
+    one element at a time, so it never needs to hold the whole `Stream`:
+
+    * `supplier` creates the initial accumulated value.
+    * `accumulator` combines the accumulated value with an element and returns the new accumulated value.
+    * `finisher` converts the accumulated value into the final result.
+    """
+
+    supplier: Callable[[], A]
+    accumulator: Callable[[A, T], A]
+    finisher: Callable[[A], R]
+
+
+def _identity(value: T) -> T:
+    return value
+
+
+def _append(elems: List[T], elem: T) -> List[T]:
+    elems.append(elem)
+    return elems
+
+
+def to_list() -> Collector[T, List[T], List[T]]:
+    """
+    Collects the elements in a list.
+    """
+    return Collector(list, _append, _identity)
+
+
+def counting() -> Collector[Any, int, int]:
+    """
+    Counts the elements.
+    """
+    return Collector(lambda: 0, lambda count, _: count + 1, _identity)
+
+
+def summing(f: Callable[[T], Any] = _identity) -> Collector[T, Any, Any]:
+    """
+    Sums the result of applying `f` to each element.
+    """
+    return Collector(lambda: 0, lambda total, elem: total + f(elem), _identity)
+
+
+def folding(initial: S, f: Callable[[S, T], S]) -> Collector[T, S, S]:
+    """
+    Combines the elements from left to right using `f`, starting with `initial`.
+    """
+    return Collector(lambda: initial, f, _identity)
+
+
+def _extreme(
+    key: Callable[[T], Any],
+    is_better: Callable[[Any, Any], bool],
+) -> Collector[T, Any, Maybe[T]]:
+    def keep_extreme(current: Any, elem: T) -> Any:
+        elem_key = key(elem)
+        return (
+            (elem_key, elem)
+            if current is _EMPTY or is_better(elem_key, current[0])
+            else current
+        )
+
+    def finish(current: Any) -> Maybe[T]:
+        return Maybe.nothing() if current is _EMPTY else Maybe.just(current[1])
+
+    return Collector(lambda: _EMPTY, keep_extreme, finish)
+
+
+def min_by(key: Callable[[T], Any] = _identity) -> Collector[T, Any, Maybe[T]]:
+    """
+    Returns the smallest element according to `key` or `Nothing` if there are no elements.
+    """
+    return _extreme(key, lambda elem_key, current_key: elem_key < current_key)
+
+
+def max_by(key: Callable[[T], Any] = _identity) -> Collector[T, Any, Maybe[T]]:
+    """
+    Returns the largest element according to `key` or `Nothing` if there are no elements.
+    """
+    return _extreme(key, lambda elem_key, current_key: elem_key > current_key)
+
+
+def to_dict(
+    key: Callable[[T], K],
+    value: Callable[[T], V] = _identity,  # type: ignore
+    merge: Callable[[V, V], V] = None,
+) -> Collector[T, Dict[K, V], Dict[K, V]]:
+    """
+    Collects the elements in a dict using `key` and `value` functions.
+    Values of repeated keys are combined with `merge`, if it is not given a `ValueError` is raised.
+    """
+
+    def put(elems: Dict[K, V], elem: T) -> Dict[K, V]:
+        elem_key, elem_value = key(elem), value(elem)
+        if elem_key in elems:
+            if merge is None:
+                raise ValueError(f"Duplicated key {elem_key!r}")
+            elem_value = merge(elems[elem_key], elem_value)
+        elems[elem_key] = elem_value
+        return elems
+
+    return Collector(dict, put, _identity)
+
+
+def grouping_by(
+    key: Callable[[T], K],
+    downstream: Collector[T, Any, R] = None,
+) -> Collector[T, Dict[K, Any], Dict[K, R]]:
+    """
+    Groups the elements by `key` and aggregates each group with `downstream` (by default `to_list()`).
+    """
+    group: Collector[Any, Any, Any] = downstream or to_list()
+
+    def put(groups: Dict[K, Any], elem: T) -> Dict[K, Any]:
+        elem_key = key(elem)
+        groups[elem_key] = group.accumulator(
+            groups[elem_key] if elem_key in groups else group.supplier(),
+            elem,
+        )
+        return groups
+
+    def finish(groups: Dict[K, Any]) -> Dict[K, R]:
+        return {
+            group_key: group.finisher(accumulated)
+            for group_key, accumulated in groups.items()
+        }
+
+    return Collector(dict, put, finish)
+
+
+def partitioning_by(
+    satisfy_condition: Callable[[T], bool],
+    downstream: Collector[T, Any, R] = None,
+) -> Collector[T, Dict[bool, Any], Dict[bool, R]]:
+    """
+    Splits the elements in the ones that satisfy the condition (`True` key) and the ones
+    that don't (`False` key), aggregating each partition with `downstream` (by default `to_list()`).
+    Both keys are always present.
+    """
+    partition: Collector[Any, Any, Any] = downstream or to_list()
+    by_condition = grouping_by(lambda elem: bool(satisfy_condition(elem)), partition)
+    return Collector(
+        lambda: {True: partition.supplier(), False: partition.supplier()},
+        by_condition.accumulator,
+        by_condition.finisher,
+    )
+
+
+@dataclass(frozen=True)
+class Summary:
+    """
+    Count, sum, min, max and mean of a group of numbers computed by `summarizing`.
+    """
+
+    count: int
+    sum: Any
+    min: Maybe[Any]
+    max: Maybe[Any]
+
+    @property
+    def mean(self) -> Maybe[float]:
+        return Maybe.nothing() if not self.count else Maybe.just(self.sum / self.count)
+
+
+def summarizing(f: Callable[[T], Any] = _identity) -> Collector[T, List[Any], Summary]:
+    """
+    Computes the count, sum, min, max and mean of the result of applying `f` to each element.
+    """
+
+    def accumulate(state: List[Any], elem: T) -> List[Any]:
+        number = f(elem)
+        if not state[0]:
+            state[:] = [1, number, number, number]
+            return state
+        state[0] += 1
+        state[1] += number
+        state[2] = number if number < state[2] else state[2]
+        state[3] = number if number > state[3] else state[3]
+        return state
+
+    def finish(state: List[Any]) -> Summary:
+        count, total, smallest, largest = state
+        if not count:
+            return Summary(0, 0, Maybe.nothing(), Maybe.nothing())
+        return Summary(count, total, Maybe.just(smallest), Maybe.just(largest))
+
+    return Collector(lambda: [0, 0, None, None], accumulate, finish)
+
+
+def combine(
+    *collectors: Collector[T, Any, Any],
+) -> Collector[T, List[Any], Tuple[Any, ...]]:
+    """
+    Runs all `collectors` in a single pass and returns a tuple with their results.
+
+    Example
+    ```
+    stream(1, 2, 3).collect(combine(counting(), summing()))  # Returns (3, 6)
+    ```
+    """
+
+    def accumulate(states: List[Any], elem: T) -> List[Any]:
+        for index, collector in enumerate(collectors):
+            states[index] = collector.accumulator(states[index], elem)
+        return states
+
+    def finish(states: List[Any]) -> Tuple[Any, ...]:
+        return tuple(
+            collector.finisher(state) for collector, state in zip(collectors, states)
+        )
+
+    return Collector(
+        lambda: [collector.supplier() for collector in collectors],
+        accumulate,
+        finish,
+    )
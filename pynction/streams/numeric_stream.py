@@ -0,0 +1,206 @@
+from itertools import chain
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+from .stream import Stream
+
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as error:  # pragma: no cover
+        raise ImportError(
+            "NumericStream requires numpy, install it with `pip install numpy`",
+        ) from error
+    return numpy
+
+
+def _apply_each(f: Callable[[Any], Any], elems: List[Any]) -> List[Any]:
+    return [f(elem) for elem in elems]
+
+
+def _expand_each(f: Callable[[Any], Iterable[Any]], elems: List[Any]) -> List[Any]:
+    return list(chain.from_iterable(f(elem) for elem in elems))
+
+
+def _interleave(parts: Any) -> Any:
+    return _numpy().column_stack(parts).ravel()
+
+
+class _Kernel:
+    """
+    Wraps a stage callable and decides, on the first chunk, whether it can be
+    applied to a whole array at once (ufunc-compatible) or whether it has to be
+    evaluated element by element.
+    """
+
+    def __init__(
+        self,
+        f: Callable[[Any], Any],
+        is_valid: Callable[[Any, Any], bool],
+        per_element: Callable[
+            [Callable[[Any], Any], List[Any]],
+            List[Any],
+        ] = _apply_each,
+        combine: Callable[[Any], Any] = lambda result: result,
+    ):
+        self.f = f
+        self.is_valid = is_valid
+        self.per_element = per_element
+        self.combine = combine
+        self.vectorized: Optional[bool] = None
+
+    def __call__(self, chunk: Any) -> Any:
+        if self.vectorized is not False:
+            try:
+                result = self.f(chunk)
+                if self.is_valid(chunk, result):
+                    self.vectorized = True
+                    return self.combine(result)
+            except (AttributeError, TypeError, ValueError):
+                if self.vectorized:
+                    raise
+            self.vectorized = False
+        return _numpy().array(self.per_element(self.f, chunk.tolist()))
+
+
+def _same_shape(chunk: Any, result: Any) -> bool:
+    return isinstance(result, _numpy().ndarray) and result.shape == chunk.shape
+
+
+def _boolean_mask(chunk: Any, result: Any) -> bool:
+    return _same_shape(chunk, result) and result.dtype == bool
+
+
+def _expansions(chunk: Any, result: Any) -> bool:
+    return isinstance(result, (list, tuple)) and all(
+        _same_shape(chunk, part) for part in result
+    )
+
+
+class NumericStream:
+    """
+    `NumericStream` is a `Stream` specialized for numbers that keeps
+    elements in chunks of NumPy arrays.
+
+    `map`, `filter`, `flat_map` and `take_while` are applied to a whole chunk at once
+    when the callable works with arrays (e.g. `lambda a: a * 2`, `numpy.sqrt`),
+    otherwise they fall back to per-element evaluation.
+
+    It requires `numpy` to be installed.
+    """
+
+    _chunks: Iterator[Any]
+
+    def __init__(self, chunks: Iterable[Any]):
+        self._chunks = (chunk for chunk in chunks if len(chunk))
+
+    def map(self, f: Callable[[Any], Any]) -> "NumericStream":
+        """
+        Applies the `f` function on each value and returns the result `NumericStream`.
+
+        Example
+        ```
+        stream_of_array(numpy.arange(4)).map(lambda a: a * 2).to_list()  # Returns [0, 2, 4, 6]
+        ```
+        """
+        kernel = _Kernel(f, _same_shape)
+        return NumericStream(kernel(chunk) for chunk in self._chunks)
+
+    def filter(self, satisfy_condition: Callable[[Any], Any]) -> "NumericStream":
+        """
+        Applies `satisfy_condition` over each value and returns a new
+        `NumericStream` with values that have satisfied the condition.
+
+        Example
+        ```
+        stream_of_array(numpy.arange(6)).filter(lambda a: a % 2 == 0).to_list()  # Returns [0, 2, 4]
+        ```
+        """
+        kernel = _Kernel(satisfy_condition, _boolean_mask)
+        return NumericStream(
+            chunk[kernel(chunk).astype(bool)] for chunk in self._chunks
+        )
+
+    def flat_map(self, f: Callable[[Any], Iterable[Any]]) -> "NumericStream":
+        """
+        Applies the `f` function on each value and then flattens the results.
+        To be vectorized `f` must return a list of arrays, one per generated element.
+
+        Example
+        ```
+        stream_of_array(numpy.arange(2)).flat_map(lambda a: [a + 1, a + 2]).to_list()  # Returns [1, 2, 2, 3]
+        ```
+        """
+        kernel = _Kernel(f, _expansions, per_element=_expand_each, combine=_interleave)
+        return NumericStream(kernel(chunk) for chunk in self._chunks)
+
+    def take_while(self, satisfy_condition: Callable[[Any], Any]) -> "NumericStream":
+        """
+        Takes the first N elements of `NumericStream` while each element evaluate `satisfy_condition` as True
+        """
+        kernel = _Kernel(satisfy_condition, _boolean_mask)
+
+        def take() -> Iterator[Any]:
+            for chunk in self._chunks:
+                mask = kernel(chunk).astype(bool)
+                if mask.all():
+                    yield chunk
+                    continue
+                yield chunk[: int(mask.argmin())]
+                return
+
+        return NumericStream(take())
+
+    def to_stream(self) -> Stream[Any]:
+        """
+        Returns a regular `Stream` with the (python) elements of the `NumericStream`.
+        """
+        return Stream(elem for chunk in self._chunks for elem in chunk.tolist())
+
+    def to_numpy(self) -> Any:
+        """
+        Concatenates every chunk in a single NumPy array.
+        """
+        chunks = list(self._chunks)
+        if not chunks:
+            return _numpy().array([])
+        return _numpy().concatenate(chunks)
+
+    def to_list(self) -> List[Any]:
+        return self.to_numpy().tolist()
+
+
+def stream_of_array(array: Any, chunksize: int = DEFAULT_CHUNK_SIZE) -> NumericStream:
+    """
+    Factory method for `NumericStream` class.
+    This method takes a NumPy array (or any sequence of numbers) and
+    creates a `NumericStream` of it, split in chunks of `chunksize` elements.
+
+    Example
+    ```
+    stream_of_array(numpy.arange(10_000_000))  # Returns NumericStream
+    ```
+    """
+    numpy = _numpy()
+    array = numpy.asarray(array).ravel()
+    return NumericStream(
+        array[start : start + chunksize] for start in range(0, len(array), chunksize)
+    )
+
+
+def stream_of_chunks(
+    elems: Iterable[Any],
+    chunksize: int = DEFAULT_CHUNK_SIZE,
+    dtype: Any = None,
+) -> NumericStream:
+    """
+    Factory method for `NumericStream` class.
+    This method takes an iterable of numbers and lazily packs them
+    in NumPy arrays of `chunksize` elements.
+    """
+    numpy = _numpy()
+    return NumericStream(
+        numpy.array(chunk, dtype=dtype) for chunk in Stream(elems).batched(chunksize)
+    )
@@ -1,7 +1,79 @@
-from typing import Callable, Iterable, Iterator, List, Set, TypeVar
+import builtins
+import contextlib
+import functools
+import heapq
+import itertools
+import os
+import socket
+import struct
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    overload,
+)
+
+from typing_extensions import Literal
+
+from pynction.monads.maybe import Maybe
+
+from . import (
+    _bloom,
+    _cache,
+    _grouping,
+    _iterators,
+    _join,
+    _parallel,
+    _pipeline,
+    _prefetch,
+    _profile,
+    _sinks,
+    _sort,
+    _sources,
+    _windows,
+    collectors,
+)
+from ._pipeline import Stage
+from .collectors import Collector
 
 T = TypeVar("T")
 S = TypeVar("S")
+K = TypeVar("K")
+R = TypeVar("R")
+V = TypeVar("V")
+
+_EMPTY: Any = object()
+
+
+def _identity(value: T) -> T:
+    return value
+
+
+def _to_maybe(value: T) -> Maybe[T]:
+    return Maybe.nothing() if value is _EMPTY else Maybe.just(value)
+
+
+Closers = List[Callable[[], Any]]
+
+
+def _close(closers: Closers) -> None:
+    for close in reversed(closers):
+        close()
+
+
+def _closing(elems: Iterator[T], closers: Closers) -> Iterator[T]:
+    try:
+        yield from elems
+    finally:
+        _close(closers)
 
 
 class StreamIter(Iterator[T]):
@@ -22,15 +94,386 @@ class Stream(Iterable[T]):
     Stream class provides a set of functionality to operate over it
     in a functional way.
     It operates in a "lazy" way to avoid any memory overhead.
+
+    Operations are only recorded until a terminal operation (`to_list`, `to_set`
+    or iterating the `Stream`) is called. At that point `map`, `filter`, `flat_map`
+    and `take_while` are chained with the builtin iterators, so no extra python
+    code runs per element apart from the given functions.
+
+    As with iterators, a `Stream` can be consumed only once and every `Stream`
+    derived from it shares its elements: once a `Stream` has started, the next
+    operations continue from its current position.
+    Stages holding resources (like `prefetch` or `par_map`) are closed as soon as
+    the terminal operation that started them finishes or stops early.
     """
 
-    _elems: Iterator[T]
+    _source: Iterable[Any]
+    _parent: Optional["Stream[Any]"]
+    _stage: Optional[Stage]
+    _stages: Tuple[Stage, ...]
+    _elems: Optional[Iterator[T]]
+    _replayable: bool
+    _profiled: bool
+    _stage_stats: Optional[_profile.StreamProfile]
 
     def __init__(
         self,
         elems: Iterable[T],
     ):
-        self._elems = iter(elems)
+        self._source = elems
+        self._parent = None
+        self._stage = None
+        self._stages = ()
+        self._elems = None
+        self._replayable = False
+        self._profiled = False
+        self._stage_stats = None
+
+    @overload
+    @staticmethod
+    def from_file(
+        path: _sources.PathLike,
+        mode: Literal["lines", "bytes"] = ...,
+        use_mmap: bool = ...,
+        read_size: int = ...,
+        encoding: None = ...,
+    ) -> "Stream[memoryview]":
+        ...
+
+    @overload
+    @staticmethod
+    def from_file(
+        path: _sources.PathLike,
+        mode: Literal["lines", "bytes"] = ...,
+        use_mmap: bool = ...,
+        read_size: int = ...,
+        *,
+        encoding: str,
+    ) -> "Stream[str]":
+        ...
+
+    @staticmethod
+    def from_file(
+        path: _sources.PathLike,
+        mode: Literal["lines", "bytes"] = "lines",
+        use_mmap: bool = True,
+        read_size: int = _sources.DEFAULT_READ_SIZE,
+        encoding: str = None,
+    ) -> "Stream[Any]":
+        """
+        Creates a `Stream` that lazily reads the file at `path`.
+
+        * `mode="lines"` returns each line without the trailing newline.
+        * `mode="bytes"` returns blocks of `read_size` bytes.
+
+        Elements are `memoryview` slices over the file contents, so no copy is made
+        unless `encoding` is given, in which case each element is decoded to `str`.
+        With `use_mmap` the file is memory mapped, otherwise it is read in blocks
+        of `read_size` bytes.
+
+        Example
+        ```
+        Stream.from_file("app.log", encoding="utf-8").filter(lambda line: "ERROR" in line).count()
+        ```
+        """
+        if mode == "lines":
+            elems = (
+                _sources.mmap_lines(path)
+                if use_mmap
+                else _sources.file_lines(path, read_size)
+            )
+        elif mode == "bytes":
+            elems = (
+                _sources.mmap_blocks(path, read_size)
+                if use_mmap
+                else _sources.file_blocks(path, read_size)
+            )
+        else:
+            raise ValueError(f"Unknown mode {mode!r}, expected 'lines' or 'bytes'")
+        file_stream: Stream[Any] = Stream(elems)
+        if encoding is None:
+            return file_stream
+        text_encoding: str = encoding
+        return file_stream.map(lambda view: str(view, text_encoding))
+
+    @overload
+    @staticmethod
+    def from_compressed(
+        path: _sources.PathLike,
+        mode: Literal["lines", "bytes"] = ...,
+        read_size: int = ...,
+        encoding: None = ...,
+        prefetch: int = ...,
+    ) -> "Stream[memoryview]":
+        ...
+
+    @overload
+    @staticmethod
+    def from_compressed(
+        path: _sources.PathLike,
+        mode: Literal["lines", "bytes"] = ...,
+        read_size: int = ...,
+        *,
+        encoding: str,
+        prefetch: int = ...,
+    ) -> "Stream[str]":
+        ...
+
+    @staticmethod
+    def from_compressed(
+        path: _sources.PathLike,
+        mode: Literal["lines", "bytes"] = "lines",
+        read_size: int = _sources.DEFAULT_READ_SIZE,
+        encoding: str = None,
+        prefetch: int = 4,
+    ) -> "Stream[Any]":
+        """
+        Creates a `Stream` that lazily decompresses the gzip, bz2 or xz/lzma file at `path`.
+        The codec is detected from the contents of the file (or its extension),
+        uncompressed files are read as they are.
+
+        The file is decompressed in blocks of `read_size` bytes in a background thread that
+        keeps up to `prefetch` blocks ready (use `prefetch=0` to decompress in the consumer thread),
+        so decompression overlaps with the next operations and the whole file is never inflated in memory.
+
+        `mode` and `encoding` work as in `from_file`.
+
+        Example
+        ```
+        Stream.from_compressed("app.log.gz", encoding="utf-8").filter(lambda line: "ERROR" in line).count()
+        ```
+        """
+        if mode not in ("lines", "bytes"):
+            raise ValueError(f"Unknown mode {mode!r}, expected 'lines' or 'bytes'")
+        blocks: Stream[Any] = Stream(_sources.compressed_blocks(path, read_size))
+        if prefetch:
+            blocks = blocks.prefetch(prefetch)
+        if mode == "lines":
+            elems: Stream[Any] = blocks._pipe("lines", _sources.block_lines)
+        else:
+            elems = blocks.map(memoryview)
+        if encoding is None:
+            return elems
+        text_encoding: str = encoding
+        return elems.map(lambda view: str(view, text_encoding))
+
+    @staticmethod
+    def from_records(
+        buffer_or_path: Any,
+        struct_format: str,
+        record_type: Callable[..., S] = None,
+        block_records: int = 4096,
+    ) -> "Stream[Any]":
+        """
+        Creates a `Stream` of fixed-size binary records described by `struct_format`
+        (see the `struct` module) from a bytes-like object or from the file at a path,
+        which is memory mapped.
+
+        Records are unpacked with `struct.iter_unpack` over `memoryview` slices of
+        `block_records` records, so bytes are never copied. Each record is a tuple,
+        or `record_type(*values)` when `record_type` is given (e.g. a `NamedTuple`).
+        A `ValueError` is raised if the size of the data is not a multiple of the record size.
+
+        Example
+        ```
+        Frame = namedtuple("Frame", ["timestamp", "value"])
+        Stream.from_records("telemetry.bin", "<qd", Frame).map(lambda frame: frame.value).sum()
+        ```
+        """
+        record_struct = struct.Struct(struct_format)
+        if isinstance(buffer_or_path, (str, os.PathLike)):
+            records = _sources.mmap_records(
+                buffer_or_path,
+                record_struct,
+                block_records,
+            )
+        else:
+            records = _sources.buffer_records(
+                buffer_or_path,
+                record_struct,
+                block_records,
+            )
+        if record_type is None:
+            return Stream(records)
+        return Stream(itertools.starmap(record_type, records))
+
+    @staticmethod
+    def from_socket(
+        sock: socket.socket,
+        framing: Literal["length-prefixed", "newline"] = "length-prefixed",
+        buffer_size: int = 1 << 16,
+        prefix_format: str = "!I",
+        max_frame_size: int = 1 << 26,
+    ) -> "Stream[memoryview]":
+        """
+        Creates a `Stream` with the frames received from `sock` until the connection is closed.
+
+        * `framing="length-prefixed"` reads frames preceded by their length packed
+          with `prefix_format` (by default a 4 bytes big-endian unsigned int).
+        * `framing="newline"` reads frames delimited by a newline (not included in the frame).
+
+        Frames bigger than `max_frame_size` raise a `ValueError`, so a peer that never sends
+        a delimiter cannot make the buffer grow without bound.
+
+        Data is received with `recv_into` in a reusable buffer of `buffer_size` bytes and each frame
+        is a `memoryview` over it, so it is only valid until the next frame is requested
+        (use `bytes(frame)` to keep it). Data is only received when the next frame is requested,
+        so a slow consumer naturally applies backpressure to the sender.
+
+        Example
+        ```
+        for message in Stream.from_socket(connection).map(lambda frame: json.loads(bytes(frame))):
+            handle(message)
+        ```
+        """
+        reader = _sources.FrameReader(sock, buffer_size)
+        if framing == "length-prefixed":
+            return Stream(
+                reader.length_prefixed(struct.Struct(prefix_format), max_frame_size),
+            )
+        if framing == "newline":
+            return Stream(reader.newline_delimited(max_frame_size))
+        raise ValueError(
+            f"Unknown framing {framing!r}, expected 'length-prefixed' or 'newline'",
+        )
+
+    @staticmethod
+    def from_jsonl(
+        path: _sources.PathLike,
+        workers: int = None,
+        chunk_bytes: int = _sources.DEFAULT_CHUNK_BYTES,
+        encoding: str = "utf-8",
+    ) -> "Stream[Any]":
+        """
+        Creates a `Stream` with the records of the JSON lines file at `path`.
+
+        The file is split in ranges of about `chunk_bytes` bytes aligned to line boundaries,
+        which are parsed in a pool of `workers` processes (defaults to the number of CPUs).
+        Records are returned lazily and in the same order as in the file.
+
+        Example
+        ```
+        Stream.from_jsonl("events.jsonl").filter(lambda event: event["type"] == "click").count()
+        ```
+        """
+        return Stream(
+            _sources.jsonl_records(
+                path,
+                encoding,
+                chunk_bytes,
+                workers or _parallel.default_workers(),
+            ),
+        )
+
+    @staticmethod
+    def from_csv(
+        path: _sources.PathLike,
+        has_header: bool = True,
+        workers: int = None,
+        chunk_bytes: int = _sources.DEFAULT_CHUNK_BYTES,
+        encoding: str = "utf-8",
+        **fmtparams: Any,
+    ) -> "Stream[Any]":
+        """
+        Creates a `Stream` with the rows of the CSV file at `path`, parsed in parallel as in `from_jsonl`.
+        When `has_header` is True rows are returned as dicts keyed by the header, otherwise as lists.
+        `fmtparams` are passed to the `csv` reader (e.g. `delimiter=";"`).
+
+        As the file is split on line boundaries, quoted values must not contain newlines.
+
+        Example
+        ```
+        Stream.from_csv("people.csv").map(lambda row: row["name"]).to_list()
+        ```
+        """
+        return Stream(
+            _sources.csv_records(
+                path,
+                has_header,
+                encoding,
+                chunk_bytes,
+                workers or _parallel.default_workers(),
+                fmtparams,
+            ),
+        )
+
+    def _then(self, stage: Optional[Stage]) -> "Stream[Any]":
+        new_stream: Stream[Any] = Stream(self._source)
+        new_stream._parent = self
+        new_stream._stage = stage
+        new_stream._stages = self._stages if stage is None else self._stages + (stage,)
+        new_stream._replayable = self._replayable
+        new_stream._profiled = self._profiled
+        return new_stream
+
+    def _pipe(
+        self,
+        name: str,
+        transform: Callable[[Iterator[T]], Iterable[S]],
+    ) -> "Stream[S]":
+        """
+        Adds a stage that receives the whole upstream iterator.
+        It is the extension point for operations that cannot be expressed element by element.
+        """
+        return self._then(Stage(_pipeline.PIPE, transform, name))
+
+    def _start(self, elems: Iterator[T]) -> Iterator[T]:
+        if not self._replayable:
+            self._elems = elems
+        return elems
+
+    def _upstream(self) -> Tuple[Iterator[Any], List["Stream[Any]"]]:
+        """
+        Returns the iterator of the closest previous `Stream` that has already started
+        (starting the source if none has) and the `Stream`s after it, up to this one.
+        Replayable `Stream`s never keep their iterator, so they always run from the source.
+        """
+        pending: List[Stream[Any]] = []
+        node: Stream[Any] = self
+        while node._elems is None and node._parent is not None:
+            pending.append(node)
+            node = node._parent
+        if node._elems is None:
+            return node._start(iter(node._source)), pending[::-1]
+        return node._elems, pending[::-1]
+
+    def _profiled_stages(self, stages: List[Optional[Stage]]) -> List[Optional[Stage]]:
+        self._stage_stats = _profile.StreamProfile(self._stages)
+        started = len(self._stages) - sum(stage is not None for stage in stages)
+        instrumented = iter(self._stage_stats.instrumented()[started:])
+        return [None if stage is None else next(instrumented) for stage in stages]
+
+    def _iterator(self) -> Tuple[Iterator[T], Closers]:
+        """
+        Starts the pending stages and returns the resulting iterator together with
+        the `close` methods of the started stages, which may hold resources
+        (threads, pools, files) until they are closed.
+        """
+        elems, pending = self._upstream()
+        stages = [pending_stream._stage for pending_stream in pending]
+        if self._profiled and pending:
+            stages = self._profiled_stages(stages)
+        closers: Closers = []
+        for pending_stream, stage in zip(pending, stages):
+            elems = pending_stream._start(
+                elems if stage is None else _pipeline.apply(stage, elems),
+            )
+            close = getattr(elems, "close", None)
+            if close is not None:
+                closers.append(close)
+        return elems, closers
+
+    @contextlib.contextmanager
+    def _consume(self) -> Iterator[Iterator[T]]:
+        """
+        Runs a terminal operation over the elements, closing the started stages
+        when it finishes or stops early.
+        """
+        elems, closers = self._iterator()
+        try:
+            yield elems
+        finally:
+            _close(closers)
 
     def map(self, f: Callable[[T], S]) -> "Stream[S]":
         """
@@ -44,7 +487,7 @@ class Stream(Iterable[T]):
         stream_of(1, 2).map(str)  # Returns `Stream[str]`
         ```
         """
-        return Stream(map(f, self._elems))
+        return self._then(Stage(_pipeline.MAP, f))
 
     def filter(self, satisfy_condition: Callable[[T], bool]) -> "Stream[T]":
         """
@@ -58,7 +501,7 @@ class Stream(Iterable[T]):
             .to_list()  # Returns [1, 2, 3, 4]
         ```
         """
-        return Stream(filter(satisfy_condition, self._elems))
+        return self._then(Stage(_pipeline.FILTER, satisfy_condition))
 
     def flat_map(self, f: Callable[[T], Iterable[S]]) -> "Stream[S]":
         """
@@ -74,35 +517,767 @@ class Stream(Iterable[T]):
         )  # Returns [1, 1, 2, 2, 3, 3, 4, 4]
         ```
         """
-
-        def all_elems() -> Iterable[S]:
-            for elem in self._elems:
-                for new_elems in f(elem):
-                    yield new_elems
-
-        return Stream(all_elems())
+        return self._then(Stage(_pipeline.FLAT_MAP, f))
 
     def take_while(self, satisfy_condition: Callable[[T], bool]) -> "Stream[T]":
         """
         Takes the first N elements of `Stream` while each element evaluate `satisfy_condition` as True
         """
+        return self._then(Stage(_pipeline.TAKE_WHILE, satisfy_condition))
+
+    def skip(self, n: int) -> "Stream[T]":
+        """
+        Discards the first `n` elements.
+        When the previous elements come straight from a `list`, a `tuple` or a `range`,
+        it jumps directly to the element `n` instead of iterating.
+
+        Example
+        ```
+        stream_of(range(10)).skip(7).to_list()  # Returns [7, 8, 9]
+        ```
+        """
+        if n < 0:
+            raise ValueError("n must be greater than or equal to 0")
+        return self._pipe("skip", lambda elems: _iterators.skip(elems, n))
+
+    def limit(self, n: int) -> "Stream[T]":
+        """
+        Takes only the first `n` elements, the rest of the `Stream` is never consumed.
+
+        Example
+        ```
+        stream_of(itertools.count()).limit(3).to_list()  # Returns [0, 1, 2]
+        ```
+        """
+        if n < 0:
+            raise ValueError("n must be greater than or equal to 0")
+        return self._pipe("limit", lambda elems: itertools.islice(elems, n))
+
+    def take(self, n: int) -> "Stream[T]":
+        """
+        Same as `limit`.
+        """
+        return self.limit(n)
+
+    def drop_while(self, satisfy_condition: Callable[[T], bool]) -> "Stream[T]":
+        """
+        Discards the first N elements of `Stream` while each element evaluate `satisfy_condition` as True
+
+        Example
+        ```
+        stream(1, 2, 3, 1).drop_while(lambda a: a < 3).to_list()  # Returns [3, 1]
+        ```
+        """
+        return self._pipe(
+            "drop_while",
+            lambda elems: itertools.dropwhile(satisfy_condition, elems),
+        )
+
+    def batched(self, size: int) -> "Stream[List[T]]":
+        """
+        Groups the elements in lists of `size` elements.
+        The last list contains the remaining elements so it could be shorter.
+
+        Example
+        ```
+        stream(1, 2, 3, 4, 5).batched(2).to_list()  # Returns [[1, 2], [3, 4], [5]]
+        ```
+        """
+        if size < 1:
+            raise ValueError("size must be greater than 0")
+        return self._pipe("batched", lambda elems: _iterators.chunks(elems, size))
+
+    def map_batches(
+        self,
+        f: Callable[[List[T]], Iterable[S]],
+        size: int,
+    ) -> "Stream[S]":
+        """
+        Applies the `f` function on batches of `size` elements
+        and then flattens the results into a single `Stream` of elements.
+        Useful when `f` is cheaper per element when it processes many elements at once
+        (e.g. bulk inserts or vectorized parsing).
+
+        Example
+        ```
+        stream(1, 2, 3, 4, 5).map_batches(lambda batch: [sum(batch)], 2).to_list()  # Returns [3, 7, 5]
+        ```
+        """
+        return self.batched(size).flat_map(f)
+
+    def sliding(self, size: int, step: int = 1) -> "Stream[Tuple[T, ...]]":
+        """
+        Groups the elements in overlapping windows of `size` elements,
+        starting a new window every `step` elements. Incomplete windows are discarded.
+        Only the last `size` elements are kept in memory.
+
+        Example
+        ```
+        stream(1, 2, 3, 4, 5).sliding(3).to_list()  # Returns [(1, 2, 3), (2, 3, 4), (3, 4, 5)]
+        stream(1, 2, 3, 4, 5).sliding(2, step=2).to_list()  # Returns [(1, 2), (3, 4)]
+        ```
+        """
+        if size < 1 or step < 1:
+            raise ValueError("size and step must be greater than 0")
+        return self._pipe("sliding", lambda elems: _windows.sliding(elems, size, step))
+
+    def tumbling(self, size: int) -> "Stream[Tuple[T, ...]]":
+        """
+        Groups the elements in consecutive non-overlapping windows of `size` elements.
+        The last window contains the remaining elements so it could be shorter.
+
+        Example
+        ```
+        stream(1, 2, 3, 4, 5).tumbling(2).to_list()  # Returns [(1, 2), (3, 4), (5,)]
+        ```
+        """
+        if size < 1:
+            raise ValueError("size must be greater than 0")
+        return self._pipe("tumbling", lambda elems: _windows.tumbling(elems, size))
+
+    def tumbling_time(
+        self,
+        duration: Any,
+        timestamp: Callable[[T], Any],
+    ) -> "Stream[Tuple[T, ...]]":
+        """
+        Groups the elements in consecutive windows of `duration` according to
+        the event time returned by `timestamp` (e.g. seconds or `datetime`/`timedelta`).
+        The first window starts at the time of the first element.
+        Elements are expected to arrive ordered by time.
+
+        Example
+        ```
+        stream(1, 2, 6, 11).tumbling_time(5, timestamp=lambda t: t).to_list()  # Returns [(1, 2), (6,), (11,)]
+        ```
+        """
+        return self._pipe(
+            "tumbling_time",
+            lambda elems: _windows.tumbling_time(elems, duration, timestamp),
+        )
+
+    def sliding_time(
+        self,
+        duration: Any,
+        timestamp: Callable[[T], Any],
+    ) -> "Stream[Tuple[T, ...]]":
+        """
+        For each element returns the window of elements whose event time, returned by `timestamp`,
+        is within the last `duration` (the element itself included).
+        Elements are expected to arrive ordered by time.
+
+        Example
+        ```
+        stream(1, 2, 5, 11).sliding_time(3, timestamp=lambda t: t).to_list()
+        # Returns [(1,), (1, 2), (5,), (11,)]
+        ```
+        """
+        return self._pipe(
+            "sliding_time",
+            lambda elems: _windows.sliding_time(elems, duration, timestamp),
+        )
+
+    def group_by(
+        self,
+        key: Callable[[T], K],
+        aggregator: Collector[T, Any, R] = None,
+    ) -> "Stream[Tuple[K, R]]":
+        """
+        Groups the elements by `key` and aggregates each group with `aggregator`
+        (a `pynction.streams.collectors.Collector`, by default `collectors.to_list()`).
+        Each group is aggregated incrementally in a single pass, so only one
+        accumulated value per key is kept in memory.
+
+        Returns a `Stream` of `(key, aggregated value)` tuples in order of first appearance.
+
+        Example
+        ```
+        dict(stream("a", "bb", "cc", "d").group_by(len, collectors.counting()))  # Returns {1: 2, 2: 2}
+        ```
+        """
+        group_aggregator: Collector[Any, Any, Any] = aggregator or collectors.to_list()
+        return self._pipe(
+            "group_by",
+            lambda elems: _grouping.group_by(elems, key, group_aggregator),
+        )
+
+    def group_adjacent(
+        self,
+        key: Callable[[T], K],
+        aggregator: Collector[T, Any, R] = None,
+    ) -> "Stream[Tuple[K, R]]":
+        """
+        Same as `group_by` but only groups consecutive elements with the same `key`,
+        so only the current group is kept in memory. Useful for inputs sorted by `key`.
+
+        Example
+        ```
+        stream(1, 1, 2, 1).group_adjacent(lambda a: a).to_list()  # Returns [(1, [1, 1]), (2, [2]), (1, [1])]
+        ```
+        """
+        group_aggregator: Collector[Any, Any, Any] = aggregator or collectors.to_list()
+        return self._pipe(
+            "group_adjacent",
+            lambda elems: _grouping.group_adjacent(elems, key, group_aggregator),
+        )
+
+    def distinct(
+        self,
+        key: Callable[[T], Any] = None,
+        approximate: bool = False,
+        capacity: int = 10_000_000,
+        error_rate: float = 0.001,
+    ) -> "Stream[T]":
+        """
+        Removes duplicated elements (according to `key` if given) keeping the first one seen,
+        so the original order is preserved.
+
+        By default every key seen is kept in a set. With `approximate` the keys are tracked
+        in a Bloom filter sized for `capacity` keys, which uses a fixed amount of memory
+        (about 1.8 MB per million keys with the default `error_rate`) but could drop a unique
+        element with probability `error_rate`. `int`, `str` and `bytes` keys are tracked
+        by value, other keys by their hash, so keys with the same hash are always duplicates.
+
+        Example
+        ```
+        stream(1, 2, 1, 3, 2).distinct().to_list()  # Returns [1, 2, 3]
+        stream("a", "bb", "c").distinct(key=len).to_list()  # Returns ["a", "bb"]
+        ```
+        """
+        key_of = key or _identity
+        if not approximate:
+            return self._pipe(
+                "distinct",
+                lambda elems: _iterators.unique(elems, key_of),
+            )
+        _bloom.check_parameters(capacity, error_rate)
+        return self._pipe(
+            "distinct",
+            lambda elems: _bloom.distinct(
+                elems,
+                key_of,
+                _bloom.BloomFilter(capacity, error_rate),
+            ),
+        )
+
+    def join(
+        self,
+        other: Iterable[S],
+        left_key: Callable[[T], Any],
+        right_key: Callable[[S], Any],
+        how: Literal["inner", "left"] = "inner",
+        memory_limit: int = 1_000_000,
+        partitions: int = 16,
+        spill_dir: str = None,
+    ) -> "Stream[Tuple[T, Any]]":
+        """
+        Joins each element of this `Stream` with the elements of `other` that have the same key.
+
+        A hash index is built over `other` (so it should be the smaller side) the first time
+        the result is consumed, then this `Stream` is lazily probed against it.
+
+        * `how="inner"` returns `(left, right)` tuples for every match.
+        * `how="left"` returns `(left, Just(right))` for every match and
+          `(left, Nothing)` for elements without matches.
+
+        If `other` has more than `memory_limit` elements, both sides are split in `partitions`
+        temporary files by key and joined partition by partition, so memory stays bounded,
+        but results are no longer returned in the original order.
+
+        Example
+        ```
+        orders = stream({"id": 1, "customer": 10}, {"id": 2, "customer": 20})
+        customers = [{"id": 10, "name": "Ann"}]
+        orders.join(customers, lambda o: o["customer"], lambda c: c["id"]).to_list()
+        # Returns [({"id": 1, "customer": 10}, {"id": 10, "name": "Ann"})]
+        ```
+        """
+        if how not in (_join.INNER, _join.LEFT):
+            raise ValueError(f"Unknown join {how!r}, expected 'inner' or 'left'")
+        return self._pipe(
+            "join",
+            lambda elems: _join.hash_join(
+                elems,
+                other,
+                left_key,
+                right_key,
+                how,
+                memory_limit,
+                partitions,
+                spill_dir,
+            ),
+        )
+
+    def sorted(
+        self,
+        key: Callable[[T], Any] = None,
+        reverse: bool = False,
+        memory_limit: int = 1_000_000,
+        spill_dir: str = None,
+    ) -> "Stream[T]":
+        """
+        Sorts the elements (by `key` if given) in a stable way.
+
+        At most `memory_limit` elements are sorted in memory at a time. Bigger inputs
+        are sorted in runs that are spilled (pickled) to temporary files in `spill_dir`
+        and lazily merged, so memory is bounded regardless of the size of the `Stream`.
+
+        Example
+        ```
+        stream(3, 1, 2).sorted().to_list()  # Returns [1, 2, 3]
+        stream("bb", "a", "ccc").sorted(key=len, reverse=True).to_list()  # Returns ["ccc", "bb", "a"]
+        ```
+        """
+        if memory_limit < 1:
+            raise ValueError("memory_limit must be greater than 0")
+        return self._pipe(
+            "sorted",
+            lambda elems: _sort.external_sort(
+                elems,
+                key,
+                reverse,
+                memory_limit,
+                spill_dir,
+            ),
+        )
+
+    def prefetch(self, size: int = 64) -> "Stream[T]":
+        """
+        Runs the previous operations in a background thread that keeps up to `size`
+        elements ready, so a slow source (file reads, DB cursors) and the next operations
+        can work at the same time.
+
+        If the consumer stops early (e.g. after `take_while`) the background thread is stopped,
+        and errors raised by the previous operations are raised to the consumer.
+
+        Example
+        ```
+        stream_of(db_cursor).prefetch(1000).map(transform).to_list()
+        ```
+        """
+        if size < 1:
+            raise ValueError("size must be greater than 0")
+        return self._pipe("prefetch", lambda elems: _prefetch.prefetch(elems, size))
+
+    def cache(self, max_items: int = None, spill_dir: str = None) -> "Stream[T]":
+        """
+        Returns a `Stream` that can be consumed many times.
+        The elements are recorded as they are consumed for the first time
+        and replayed by the next consumers, so the previous operations run only once.
+
+        With `max_items` only that number of elements are kept in memory,
+        the rest are spilled to temporary files in `spill_dir`.
+
+        Example
+        ```
+        numbers = stream_of(range(5)).map(expensive_computation).cache()
+        numbers.sum()  # Computes expensive_computation for each element
+        numbers.max()  # Replays the recorded results
+        ```
+        """
+        cached: Stream[T] = Stream(_cache.Cache(iter(self), max_items, spill_dir))
+        cached._replayable = True
+        return cached
+
+    def tee(self, n: int = 2) -> Tuple["Stream[T]", ...]:
+        """
+        Splits the `Stream` in `n` independent `Stream`s sharing a single evaluation
+        of the previous operations. Elements are buffered only until every
+        `Stream` has consumed them, so memory depends on how far apart the consumers are.
+
+        Example
+        ```
+        evens, odds = stream_of(range(10)).tee()
+        evens.filter(lambda n: n % 2 == 0).to_list()  # Returns [0, 2, 4, 6, 8]
+        odds.filter(lambda n: n % 2 == 1).to_list()  # Returns [1, 3, 5, 7, 9]
+        ```
+        """
+        return tuple(Stream(elems) for elems in itertools.tee(iter(self), n))
+
+    def par_map(
+        self,
+        f: Callable[[T], S],
+        workers: int = None,
+        chunksize: int = 256,
+        ordered: bool = True,
+    ) -> "Stream[S]":
+        """
+        Same as `map` but `f` is applied in a pool of `workers` processes
+        (defaults to the number of CPUs), which is useful for CPU-bound transformations.
+
+        Elements are sent to the workers in chunks of `chunksize` elements and
+        at most `2 * workers` chunks are in flight at the same time, so the `Stream`
+        remains lazy and memory stays bounded even for infinite sources.
+
+        When `ordered` is False the results are returned as soon as each chunk is
+        completed instead of preserving the original order.
+
+        `f` must be picklable (e.g. a module-level function, not a lambda).
+
+        Example
+        ```
+        stream_of(range(1_000_000)).par_map(expensive_computation, workers=8).to_list()
+        ```
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be greater than 0")
+        return self._pipe(
+            "par_map",
+            lambda elems: _parallel.par_map(
+                elems,
+                f,
+                workers=workers or _parallel.default_workers(),
+                chunksize=chunksize,
+                ordered=ordered,
+            ),
+        )
+
+    def par_reduce(
+        self,
+        key: Callable[[T], K],
+        mapper: Callable[[T], V],
+        combiner: Callable[[V, V], V],
+        reducer: Callable[[V, V], V] = None,
+        workers: int = None,
+        chunksize: int = 4096,
+    ) -> Dict[K, V]:
+        """
+        Map-reduce aggregation using a pool of `workers` processes (defaults to the number of CPUs).
+
+        The elements are sent to the workers in chunks of `chunksize` elements, each worker
+        maps every element to a `(key(elem), mapper(elem))` pair and combines the values
+        with the same key using `combiner`. Only these partial results (one value per key
+        and chunk) are sent back, where they are merged with `reducer` (defaults to `combiner`).
+
+        `combiner` and `reducer` must be associative, and all the functions picklable.
+
+        Example
+        ```
+        stream_of(words).par_reduce(key=str.lower, mapper=lambda _: 1, combiner=operator.add)
+        # Returns a dict with the number of occurrences of each word
+        ```
+        """
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be greater than 0")
+        if chunksize < 1:
+            raise ValueError("chunksize must be greater than 0")
+        return _parallel.par_reduce(
+            iter(self),
+            key,
+            mapper,
+            combiner,
+            reducer or combiner,
+            workers=workers or _parallel.default_workers(),
+            chunksize=chunksize,
+        )
+
+    def map_concurrent(
+        self,
+        f: Callable[[T], S],
+        max_workers: int = 8,
+        max_in_flight: int = None,
+        ordered: bool = True,
+    ) -> "Stream[S]":
+        """
+        Same as `map` but `f` is applied in a pool of `max_workers` threads,
+        which is useful for I/O-bound transformations like HTTP or DB lookups.
 
-        def take() -> Iterable[T]:
-            for elem in self._elems:
-                if not satisfy_condition(elem):
-                    return
-                yield elem
+        At most `max_in_flight` calls (defaults to `2 * max_workers`) are pending
+        at the same time. Results are returned in the original order unless `ordered`
+        is False, in which case they are returned as soon as they are completed.
 
-        return Stream(take())
+        If `f` raises, the exception is propagated to the consumer and the pending
+        calls are cancelled.
+
+        Example
+        ```
+        stream_of(user_ids).map_concurrent(fetch_user, max_workers=16).to_list()
+        ```
+        """
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be greater than 0")
+        return self._pipe(
+            "map_concurrent",
+            lambda elems: _parallel.map_concurrent(
+                elems,
+                f,
+                max_workers=max_workers,
+                max_in_flight=max_in_flight or 2 * max_workers,
+                ordered=ordered,
+            ),
+        )
+
+    def profile(self) -> "Stream[T]":
+        """
+        Returns the same `Stream` with profiling enabled: after the terminal operation
+        the number of elements in and out, the selectivity and the time spent in each stage
+        are available through `stats` and `explain`.
+        Stages added after calling `profile` are profiled too.
+        Streams that are not profiled don't pay any overhead.
+
+        Example
+        ```
+        numbers = stream_of(range(10)).filter(lambda n: n % 2 == 0).map(str).profile()
+        numbers.to_list()
+        print(numbers.explain())
+        ```
+        """
+        profiled: Stream[T] = self._then(None)
+        profiled._profiled = True
+        return profiled
+
+    @property
+    def stats(self) -> Maybe[_profile.StreamProfile]:
+        """
+        Returns the per-stage statistics of a profiled `Stream` once
+        its terminal operation has run, otherwise `Nothing`.
+        """
+        return (
+            Maybe.nothing()
+            if self._stage_stats is None
+            else Maybe.just(self._stage_stats)
+        )
+
+    def explain(self) -> str:
+        """
+        Describes the source and the stages of the `Stream`.
+        For profiled `Stream`s that have already run it also includes the statistics of each stage.
+        """
+        return _profile.explain(self._source, self._stages, self._stage_stats)
 
     def __iter__(self) -> Iterator[T]:
-        return StreamIter(self._elems)
+        elems, closers = self._iterator()
+        return _closing(elems, closers) if closers else elems
 
     def to_list(self) -> List[T]:
-        return list(self._elems)
+        with self._consume() as elems:
+            return list(elems)
 
     def to_set(self) -> Set[T]:
-        return set(self._elems)
+        with self._consume() as elems:
+            return set(elems)
+
+    def to_file(
+        self,
+        path: _sources.PathLike,
+        encoding: str = "utf-8",
+        compress: bool = None,
+        buffer_size: int = _sinks.DEFAULT_BUFFER_SIZE,
+    ) -> int:
+        """
+        Writes each element in a line of the file at `path` as the elements are produced,
+        and returns the number of lines written. `str` elements are encoded with `encoding`,
+        bytes-like elements are written as they are and any other element is converted with `str`.
+
+        Writes are buffered in chunks of `buffer_size` bytes. The file is gzip compressed
+        when `compress` is True (by default when `path` ends with `.gz`).
+        The file is always closed, even when a previous operation raises an error.
+
+        Example
+        ```
+        stream_of(range(3)).to_file("numbers.txt")  # Returns 3
+        ```
+        """
+        return _sinks.write_lines(path, self, str, encoding, compress, buffer_size)
+
+    def to_jsonl(
+        self,
+        path: _sources.PathLike,
+        encoding: str = "utf-8",
+        compress: bool = None,
+        buffer_size: int = _sinks.DEFAULT_BUFFER_SIZE,
+    ) -> int:
+        """
+        Same as `to_file` but each element is serialized as JSON.
+
+        Example
+        ```
+        stream({"id": 1}, {"id": 2}).to_jsonl("records.jsonl.gz")  # Returns 2
+        ```
+        """
+        return _sinks.write_lines(
+            path,
+            self,
+            _sinks.to_json,
+            encoding,
+            compress,
+            buffer_size,
+        )
+
+    def to_csv(
+        self,
+        path: _sources.PathLike,
+        header: Sequence[str] = None,
+        encoding: str = "utf-8",
+        compress: bool = None,
+        buffer_size: int = _sinks.DEFAULT_BUFFER_SIZE,
+    ) -> int:
+        """
+        Same as `to_file` but each element is written as a CSV row, returns the number of rows
+        written (without the header). Elements can be sequences, written after `header` if given,
+        or dicts, in which case `header` (by default the keys of the first element) selects the columns.
+
+        Example
+        ```
+        stream({"id": 1, "name": "Ann"}).to_csv("people.csv")  # Returns 1
+        ```
+        """
+        return _sinks.write_csv(
+            path,
+            iter(self),
+            header,
+            encoding,
+            compress,
+            buffer_size,
+        )
+
+    def to_numpy(self, dtype: Any = None) -> Any:
+        """
+        Collects the elements in a NumPy array (requires `numpy` to be installed).
+        Use `pynction.streams.numeric_stream.stream_of_array` to keep operating
+        over the array with vectorized operations.
+        """
+        from .numeric_stream import stream_of_chunks
+
+        return stream_of_chunks(self, dtype=dtype).to_numpy()
+
+    def collect(self, collector: Collector[T, Any, R]) -> R:
+        """
+        Aggregates the elements in a single pass using a `pynction.streams.collectors.Collector`.
+        Use `collectors.combine` to compute many aggregations at once.
+
+        Example
+        ```
+        stream("a", "bb", "cc").collect(collectors.grouping_by(len))  # Returns {1: ["a"], 2: ["bb", "cc"]}
+        stream(1, 2, 3).collect(collectors.combine(collectors.counting(), collectors.summing()))  # Returns (3, 6)
+        ```
+        """
+        with self._consume() as elems:
+            accumulated = functools.reduce(
+                collector.accumulator,
+                elems,
+                collector.supplier(),
+            )
+        return collector.finisher(accumulated)
+
+    def find_first(self, satisfy_condition: Callable[[T], bool] = None) -> Maybe[T]:
+        """
+        Returns the first element that satisfies `satisfy_condition` (or just the first element
+        when no condition is given) wrapped in a `Just`, or `Nothing` if there is no such element.
+        It stops consuming the `Stream` as soon as the element is found.
+
+        Example
+        ```
+        stream(1, 2, 3, 4).find_first(lambda a: a > 2)  # Returns Just(3)
+        stream(1, 2).find_first(lambda a: a > 2)  # Returns Nothing
+        ```
+        """
+        with self._consume() as elems:
+            if satisfy_condition is not None:
+                elems = filter(satisfy_condition, elems)
+            return _to_maybe(next(elems, _EMPTY))
+
+    def any_match(self, satisfy_condition: Callable[[T], bool]) -> bool:
+        """
+        Returns True as soon as one element satisfies `satisfy_condition`.
+
+        Example
+        ```
+        stream(1, 2, 3).any_match(lambda a: a > 2)  # Returns True
+        ```
+        """
+        with self._consume() as elems:
+            return any(map(satisfy_condition, elems))
+
+    def all_match(self, satisfy_condition: Callable[[T], bool]) -> bool:
+        """
+        Returns False as soon as one element does not satisfy `satisfy_condition`.
+
+        Example
+        ```
+        stream(1, 2, 3).all_match(lambda a: a > 2)  # Returns False
+        ```
+        """
+        with self._consume() as elems:
+            return all(map(satisfy_condition, elems))
+
+    def reduce(self, f: Callable[[T, T], T]) -> Maybe[T]:
+        """
+        Combines the elements from left to right using `f`.
+        Returns `Nothing` if the `Stream` is empty.
+
+        Example
+        ```
+        stream(1, 2, 3).reduce(lambda a, b: a + b)  # Returns Just(6)
+        ```
+        """
+        with self._consume() as elems:
+            first = next(elems, _EMPTY)
+            if first is _EMPTY:
+                return Maybe.nothing()
+            return Maybe.just(functools.reduce(f, elems, first))
+
+    def fold(self, initial: S, f: Callable[[S, T], S]) -> S:
+        """
+        Combines the elements from left to right using `f`, starting with `initial`.
+
+        Example
+        ```
+        stream(1, 2, 3).fold("", lambda acc, a: acc + str(a))  # Returns "123"
+        ```
+        """
+        with self._consume() as elems:
+            return functools.reduce(f, elems, initial)
+
+    def count(self) -> int:
+        """
+        Returns the number of elements of the `Stream`.
+        """
+        count = 0
+        with self._consume() as elems:
+            for _ in elems:
+                count += 1
+        return count
+
+    def sum(self, start: Any = 0) -> Any:
+        """
+        Returns the sum of the elements of the `Stream` plus `start`.
+
+        Example
+        ```
+        stream(1, 2, 3).sum()  # Returns 6
+        ```
+        """
+        with self._consume() as elems:
+            return builtins.sum(elems, start)
+
+    def min(self, key: Callable[[T], Any] = None) -> Maybe[T]:
+        """
+        Returns the smallest element (according to `key` if given)
+        or `Nothing` if the `Stream` is empty.
+
+        Example
+        ```
+        stream("aaa", "b", "cc").min(len)  # Returns Just("b")
+        ```
+        """
+        by_key: Callable[[T], Any] = key or _identity
+        with self._consume() as elems:
+            return _to_maybe(builtins.min(elems, key=by_key, default=_EMPTY))
+
+    def max(self, key: Callable[[T], Any] = None) -> Maybe[T]:
+        """
+        Returns the largest element (according to `key` if given)
+        or `Nothing` if the `Stream` is empty.
+
+        Example
+        ```
+        stream("aaa", "b", "cc").max(len)  # Returns Just("aaa")
+        ```
+        """
+        by_key: Callable[[T], Any] = key or _identity
+        with self._consume() as elems:
+            return _to_maybe(builtins.max(elems, key=by_key, default=_EMPTY))
 
 
 def stream(*args: T) -> Stream[T]:
@@ -132,3 +1307,21 @@ def stream_of(elems: Iterable[T]) -> Stream[T]:
     ```
     """
     return Stream(elems)
+
+
+def merge_sorted(
+    *streams: Iterable[T],
+    key: Callable[[T], Any] = None,
+    reverse: bool = False,
+) -> Stream[T]:
+    """
+    Factory method for `Stream` class.
+    This method takes N iterables already sorted (by `key` if given) and lazily
+    merges them in a single sorted `Stream`, using a heap so each element costs O(log N).
+
+    Example
+    ```
+    merge_sorted(stream(1, 4, 7), [2, 5], stream(3, 6))  # Returns Stream[int] with 1, 2, 3, 4, 5, 6, 7
+    ```
+    """
+    return Stream(heapq.merge(*streams, key=key, reverse=reverse))
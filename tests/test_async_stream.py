@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from pynction.streams.async_stream import async_stream, async_stream_of
+
+
+async def async_range(n: int):
+    for i in range(n):
+        yield i
+
+
+class TestAsyncStream:
+    def test_it_should_create_stream_from_async_generator(self):
+        example_stream = async_stream_of(async_range(4))
+
+        assert asyncio.run(example_stream.to_list()) == [0, 1, 2, 3]
+
+    def test_it_should_transform_elements_with_coroutine_functions(self):
+        async def double(x: int) -> int:
+            await asyncio.sleep(0)
+            return x * 2
+
+        example_stream = async_stream(1, 2, 3)
+
+        assert asyncio.run(example_stream.map(double).to_list()) == [2, 4, 6]
+
+    def test_it_should_overlap_awaits_up_to_concurrency_limit(self):
+        running = 0
+        max_running = 0
+
+        async def track(x: int) -> int:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return x
+
+        example_stream = async_stream_of(range(10)).map(track, concurrency=3)
+
+        assert asyncio.run(example_stream.to_list()) == list(range(10))
+        assert max_running == 3
+
+    @pytest.mark.parametrize("operation", ["map", "filter", "flat_map"])
+    def test_it_should_reject_concurrency_lower_than_one(self, operation):
+        example_stream = async_stream(1, 2, 3)
+
+        with pytest.raises(ValueError, match="concurrency must be greater than 0"):
+            getattr(example_stream, operation)(lambda x: [x], concurrency=0)
+
+    def test_it_should_filter_flatten_and_take_elements(self):
+        async def is_even(x: int) -> bool:
+            return x % 2 == 0
+
+        example_stream = (
+            async_stream_of(range(10))
+            .filter(is_even, concurrency=2)
+            .flat_map(lambda x: [x, x + 1])
+            .take_while(lambda x: x < 6)
+        )
+
+        assert asyncio.run(example_stream.to_list()) == [0, 1, 2, 3, 4, 5]
+
+    def test_it_should_convert_elements_to_set(self):
+        example_stream = async_stream(1, 1, 2, 2)
+
+        assert asyncio.run(example_stream.to_set()) == {1, 2}
+
+    def test_async_stream_should_be_async_iterable(self):
+        async def collect():
+            return [elem async for elem in async_stream(1, 2, 3)]
+
+        assert asyncio.run(collect()) == [1, 2, 3]
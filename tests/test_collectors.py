@@ -0,0 +1,65 @@
+import pytest
+
+from pynction.streams import collectors
+from pynction.streams.stream import stream, stream_of
+
+
+class TestCollectors:
+    def test_it_should_collect_elements_in_dict(self):
+        result = stream("a", "bb", "ccc").collect(collectors.to_dict(len))
+
+        assert result == {1: "a", 2: "bb", 3: "ccc"}
+
+    def test_it_should_merge_values_of_repeated_keys(self):
+        result = stream("a", "b", "cc").collect(
+            collectors.to_dict(len, str.upper, merge=lambda a, b: a + b),
+        )
+
+        assert result == {1: "AB", 2: "CC"}
+
+    def test_it_should_raise_error_with_repeated_keys_without_merge(self):
+        with pytest.raises(ValueError, match="Duplicated key 1"):
+            stream("a", "b").collect(collectors.to_dict(len))
+
+    def test_it_should_group_elements(self):
+        assert stream("a", "bb", "c").collect(collectors.grouping_by(len)) == {
+            1: ["a", "c"],
+            2: ["bb"],
+        }
+        assert stream("a", "bb", "c").collect(
+            collectors.grouping_by(len, collectors.counting()),
+        ) == {1: 2, 2: 1}
+
+    def test_it_should_partition_elements(self):
+        result = stream_of(range(5)).collect(
+            collectors.partitioning_by(lambda x: x > 10, collectors.counting()),
+        )
+
+        assert result == {True: 0, False: 5}
+
+    def test_it_should_summarize_elements(self):
+        summary = stream(3, 1, 2).collect(collectors.summarizing())
+
+        assert (summary.count, summary.sum) == (3, 6)
+        assert (str(summary.min), str(summary.max), str(summary.mean)) == (
+            "Just[1]",
+            "Just[3]",
+            "Just[2.0]",
+        )
+        assert stream().collect(collectors.summarizing()).mean.is_empty is True
+
+    def test_it_should_combine_collectors_in_a_single_pass(self):
+        numbers = stream_of(iter(range(1, 5)))
+
+        result = numbers.collect(
+            collectors.combine(
+                collectors.counting(),
+                collectors.summing(),
+                collectors.max_by(),
+                collectors.partitioning_by(lambda x: x % 2 == 0),
+            ),
+        )
+
+        count, total, largest, partitions = result
+        assert (count, total, largest.get_or_else(0)) == (4, 10, 4)
+        assert partitions == {True: [2, 4], False: [1, 3]}
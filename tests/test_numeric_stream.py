@@ -0,0 +1,51 @@
+import math
+
+import pytest
+
+from pynction.streams.numeric_stream import stream_of_array, stream_of_chunks
+from pynction.streams.stream import stream_of
+
+numpy = pytest.importorskip("numpy")
+
+
+class TestNumericStream:
+    def test_it_should_apply_vectorized_operations(self):
+        example_stream = stream_of_array(numpy.arange(20), chunksize=6)
+
+        result = (
+            example_stream.filter(lambda x: x % 2 == 0)
+            .map(lambda a: a * 2)
+            .flat_map(lambda a: [a + 1, a + 2])
+            .take_while(lambda a: a < 20)
+        )
+
+        assert result.to_list() == [1, 2, 5, 6, 9, 10, 13, 14, 17, 18]
+
+    def test_it_should_fall_back_to_per_element_evaluation(self):
+        example_stream = stream_of_array(numpy.array([1, 4, 9]))
+
+        result = example_stream.map(math.sqrt).filter(
+            lambda x: True if x > 1 else False,
+        )
+
+        assert result.to_list() == [2.0, 3.0]
+
+    def test_it_should_fall_back_when_arrays_lack_the_attribute(self):
+        example_stream = stream_of_array(numpy.arange(5))
+
+        result = example_stream.map(lambda x: x.bit_length())
+
+        assert result.to_list() == [0, 1, 2, 2, 3]
+
+    def test_it_should_pack_iterables_in_chunks(self):
+        example_stream = stream_of_chunks(range(10), chunksize=3)
+
+        assert example_stream.map(lambda a: a + 1).to_numpy().tolist() == list(
+            range(1, 11),
+        )
+
+    def test_stream_should_be_converted_to_numpy_array(self):
+        array = stream_of(range(5)).map(lambda x: x * 2).to_numpy()
+
+        assert isinstance(array, numpy.ndarray)
+        assert array.tolist() == [0, 2, 4, 6, 8]
@@ -1,6 +1,29 @@
+import bz2
+import collections
+import gzip
+import itertools
+import json
+import lzma
+import multiprocessing
+import operator
+import socket
+import struct
+import threading
+import time
+from datetime import datetime, timedelta
+
 import pytest
 
-from pynction.streams.stream import stream, stream_of
+from pynction.streams import _join, _sort, _sources, collectors
+from pynction.streams.stream import Stream, merge_sorted, stream, stream_of
+
+
+def square(n: int) -> int:
+    return n * n
+
+
+def last_digit(n: int) -> int:
+    return n % 10
 
 
 class TestStream:
@@ -90,3 +113,892 @@ class TestStream:
         example_stream = stream(1, 2, 3, 4)
 
         assert list(example_stream) == [1, 2, 3, 4]
+
+    def test_it_should_transform_elements_in_parallel_preserving_order(self):
+        example_stream = stream_of(range(1, 101))
+
+        squares = example_stream.par_map(square, workers=2, chunksize=7)
+
+        assert squares.to_list() == [n * n for n in range(1, 101)]
+
+    def test_it_should_transform_elements_in_parallel_without_order(self):
+        example_stream = stream_of(range(1, 101))
+
+        squares = example_stream.par_map(square, workers=2, chunksize=7, ordered=False)
+
+        assert sorted(squares.to_list()) == [n * n for n in range(1, 101)]
+
+    def test_par_map_should_be_lazy_over_infinite_streams(self):
+        example_stream = stream_of(itertools.count())
+
+        squares = example_stream.par_map(square, workers=2, chunksize=4).take_while(
+            lambda n: n < 100,
+        )
+
+        assert squares.to_list() == [0, 1, 4, 9, 16, 25, 36, 49, 64, 81]
+
+    def test_par_map_should_stop_workers_while_stream_is_referenced(self):
+        example_stream = stream_of(itertools.count()).par_map(square, workers=2)
+        squares = example_stream.take_while(lambda n: n < 100)
+
+        assert squares.to_list() == [0, 1, 4, 9, 16, 25, 36, 49, 64, 81]
+        assert multiprocessing.active_children() == []
+
+    def test_par_map_should_reject_empty_chunks(self):
+        with pytest.raises(ValueError, match="chunksize must be greater than 0"):
+            stream(1, 2, 3).par_map(square, chunksize=0)
+
+    def test_it_should_transform_elements_concurrently_preserving_order(self):
+        example_stream = stream_of(range(1, 51))
+
+        doubled_numbers = example_stream.map_concurrent(
+            lambda x: x * 2,
+            max_workers=4,
+            max_in_flight=5,
+        )
+
+        assert doubled_numbers.to_list() == [n * 2 for n in range(1, 51)]
+
+    def test_it_should_transform_elements_concurrently_in_completion_order(self):
+        def slow_for_first(x: int) -> int:
+            if x == 1:
+                time.sleep(0.05)
+            return x
+
+        example_stream = stream(1, 2, 3)
+
+        result = example_stream.map_concurrent(
+            slow_for_first,
+            max_workers=3,
+            ordered=False,
+        )
+
+        assert result.to_list()[-1] == 1
+
+    def test_map_concurrent_should_propagate_first_exception(self):
+        def explode_on_three(x: int) -> int:
+            if x == 3:
+                raise ValueError("Boom!")
+            return x
+
+        example_stream = stream_of(range(1, 10))
+
+        with pytest.raises(ValueError, match="Boom!"):
+            example_stream.map_concurrent(explode_on_three, max_workers=2).to_list()
+
+    def test_map_concurrent_should_stop_threads_while_stream_is_referenced(self):
+        example_stream = stream_of(itertools.count()).map_concurrent(square)
+        squares = example_stream.take_while(lambda n: n < 100)
+
+        assert squares.to_list() == [0, 1, 4, 9, 16, 25, 36, 49, 64, 81]
+        assert not any(
+            thread.name.startswith("ThreadPoolExecutor")
+            for thread in threading.enumerate()
+        )
+
+    def test_map_concurrent_should_reject_no_calls_in_flight(self):
+        with pytest.raises(ValueError, match="max_in_flight must be greater than 0"):
+            stream(1, 2, 3).map_concurrent(square, max_in_flight=0)
+
+    def test_it_should_chain_operations_into_same_result(self):
+        example_stream = stream_of(range(20))
+
+        result = (
+            example_stream.filter(lambda x: x % 2 == 0)
+            .map(lambda x: x * 2)
+            .flat_map(lambda x: [x + 1, x + 2])
+            .filter(lambda x: x % 3 != 0)
+            .take_while(lambda x: x < 30)
+        )
+
+        assert result.to_list() == [1, 2, 5, 10, 13, 14, 17, 22, 25, 26, 29]
+
+    def test_it_should_not_yield_elements_twice(self):
+        example_stream = stream(1, 2, 3).map(lambda x: x + 1)
+
+        assert example_stream.to_list() == [2, 3, 4]
+        assert example_stream.to_list() == []
+
+    def test_it_should_continue_from_partially_iterated_stream(self):
+        example_stream = stream(1, 2, 3, 4).map(lambda x: x * 10)
+
+        iterator = iter(example_stream)
+        next(iterator)
+
+        assert example_stream.to_set() == {20, 30, 40}
+
+    def test_derived_streams_should_share_elements_with_their_parent(self):
+        calls = []
+
+        def record(x: int) -> int:
+            calls.append(x)
+            return x
+
+        example_stream = stream_of([1, 2, 3]).map(record)
+
+        assert example_stream.filter(lambda x: x > 1).to_list() == [2, 3]
+        assert example_stream.filter(lambda x: x < 3).to_list() == []
+        assert calls == [1, 2, 3]
+
+    def test_derived_streams_should_continue_from_started_parent(self):
+        example_stream = stream_of([1, 2, 3, 4])
+
+        iterator = iter(example_stream)
+        next(iterator)
+
+        assert example_stream.map(square).to_list() == [4, 9, 16]
+        assert example_stream.to_list() == []
+        assert example_stream.map(square).to_list() == []
+
+    def test_it_should_group_elements_in_batches(self):
+        example_stream = stream(1, 2, 3, 4, 5)
+
+        assert example_stream.batched(2).to_list() == [[1, 2], [3, 4], [5]]
+
+    def test_it_should_transform_elements_by_batches(self):
+        calls = []
+
+        def double_all(batch):
+            calls.append(len(batch))
+            return [x * 2 for x in batch]
+
+        example_stream = stream_of(range(1, 8))
+
+        assert example_stream.map_batches(double_all, 3).to_list() == [
+            2,
+            4,
+            6,
+            8,
+            10,
+            12,
+            14,
+        ]
+        assert calls == [3, 3, 1]
+
+    def test_it_should_find_first_element_satisfying_condition_without_consuming_the_rest(
+        self,
+    ):
+        example_stream = stream_of(itertools.count(1))
+
+        result = example_stream.find_first(lambda x: x % 5 == 0)
+
+        assert str(result) == "Just[5]"
+
+    def test_it_should_return_nothing_when_no_element_is_found(self):
+        assert stream(1, 2, 3).find_first(lambda x: x > 3).is_empty is True
+        assert stream().find_first().is_empty is True
+
+    def test_it_should_return_just_for_falsy_elements(self):
+        assert str(stream(0, 1).find_first()) == "Just[0]"
+
+    def test_it_should_check_if_any_or_all_elements_match(self):
+        assert stream_of(itertools.count()).any_match(lambda x: x > 10) is True
+        assert stream_of(itertools.count()).all_match(lambda x: x < 10) is False
+        assert stream(2, 4).all_match(lambda x: x % 2 == 0) is True
+
+    def test_it_should_reduce_and_fold_elements(self):
+        assert str(stream(1, 2, 3).reduce(lambda a, b: a + b)) == "Just[6]"
+        empty: Stream[int] = stream()
+        assert empty.reduce(lambda a, b: a + b).is_empty is True
+        assert stream(1, 2, 3).fold("", lambda acc, a: acc + str(a)) == "123"
+
+    def test_it_should_aggregate_elements(self):
+        assert stream(1, 2, 3).count() == 3
+        assert stream(1, 2, 3).sum() == 6
+        assert str(stream("aaa", "b", "cc").min(len)) == "Just[b]"
+        assert str(stream(3, 1, 2).max()) == "Just[3]"
+        assert stream().max().is_empty is True
+
+    @pytest.mark.parametrize("use_mmap", [True, False])
+    def test_it_should_read_lines_from_file(self, tmp_path, use_mmap):
+        path = tmp_path / "example.log"
+        path.write_bytes(b"first\nsecond\n\nlast")
+
+        lines = (
+            Stream.from_file(path, use_mmap=use_mmap, read_size=4).map(bytes).to_list()
+        )
+
+        assert lines == [b"first", b"second", b"", b"last"]
+
+    def test_it_should_decode_lines_from_file(self, tmp_path):
+        path = tmp_path / "example.log"
+        path.write_text("año\nñandú\n", encoding="utf-8")
+
+        assert Stream.from_file(path, encoding="utf-8").to_list() == ["año", "ñandú"]
+
+    @pytest.mark.parametrize("use_mmap", [True, False])
+    def test_it_should_read_blocks_from_file(self, tmp_path, use_mmap):
+        path = tmp_path / "example.bin"
+        path.write_bytes(bytes(range(10)))
+
+        blocks = (
+            Stream.from_file(path, mode="bytes", use_mmap=use_mmap, read_size=4)
+            .map(bytes)
+            .to_list()
+        )
+
+        assert blocks == [bytes([0, 1, 2, 3]), bytes([4, 5, 6, 7]), bytes([8, 9])]
+
+    @pytest.mark.parametrize("mode", ["lines", "bytes"])
+    def test_it_should_unmap_file_once_read(self, tmp_path, monkeypatch, mode):
+        path = tmp_path / "example.bin"
+        path.write_bytes(b"first\nsecond")
+        mappings = []
+        close_mmap = _sources._close_mmap
+
+        def record(mapped):
+            close_mmap(mapped)
+            mappings.append(mapped)
+
+        monkeypatch.setattr(_sources, "_close_mmap", record)
+
+        Stream.from_file(path, mode=mode, read_size=4).map(bytes).to_list()
+
+        assert [mapped.closed for mapped in mappings] == [True]
+
+    def test_it_should_read_empty_file(self, tmp_path):
+        path = tmp_path / "empty.log"
+        path.write_bytes(b"")
+
+        assert Stream.from_file(path).to_list() == []
+
+    def test_it_should_group_elements_in_sliding_windows(self):
+        assert stream(1, 2, 3, 4, 5).sliding(3).to_list() == [
+            (1, 2, 3),
+            (2, 3, 4),
+            (3, 4, 5),
+        ]
+        assert stream(1, 2, 3, 4, 5, 6, 7).sliding(2, step=3).to_list() == [
+            (1, 2),
+            (4, 5),
+        ]
+        assert stream(1, 2).sliding(3).to_list() == []
+
+    def test_it_should_group_elements_in_tumbling_windows(self):
+        assert stream(1, 2, 3, 4, 5).tumbling(2).to_list() == [(1, 2), (3, 4), (5,)]
+
+    def test_it_should_group_elements_in_time_windows(self):
+        events = stream_of([(1, "a"), (2, "b"), (5, "c"), (6, "d"), (11, "e")])
+
+        windows = events.tumbling_time(5, timestamp=lambda event: event[0]).map(len)
+
+        assert windows.to_list() == [3, 1, 1]
+
+    def test_it_should_group_elements_in_datetime_windows(self):
+        start = datetime(2023, 1, 1, 10, 0, 30)
+        events = stream_of(
+            [start + timedelta(seconds=offset) for offset in (0, 50, 70, 200)],
+        )
+
+        windows = events.tumbling_time(
+            timedelta(minutes=1),
+            timestamp=lambda event: event,
+        )
+
+        assert windows.map(len).to_list() == [2, 1, 1]
+
+    def test_it_should_group_elements_in_sliding_time_windows(self):
+        example_stream = stream(1, 2, 4, 5, 9)
+
+        windows = example_stream.sliding_time(3, timestamp=lambda t: t)
+
+        assert windows.to_list() == [(1,), (1, 2), (2, 4), (4, 5), (9,)]
+
+    def test_it_should_group_elements_by_key(self):
+        example_stream = stream("a", "bb", "cc", "d", "eee")
+
+        assert dict(example_stream.group_by(len)) == {
+            1: ["a", "d"],
+            2: ["bb", "cc"],
+            3: ["eee"],
+        }
+
+    def test_it_should_aggregate_groups_incrementally(self):
+        numbers = list(range(10))
+
+        assert dict(
+            stream_of(numbers).group_by(lambda x: x % 2, collectors.counting()),
+        ) == {0: 5, 1: 5}
+        assert dict(
+            stream_of(numbers).group_by(lambda x: x % 2, collectors.summing()),
+        ) == {0: 20, 1: 25}
+        grouped_max = dict(
+            stream_of(numbers).group_by(lambda x: x % 3, collectors.max_by()),
+        )
+        assert {key: value.get_or_else(-1) for key, value in grouped_max.items()} == {
+            0: 9,
+            1: 7,
+            2: 8,
+        }
+
+    def test_it_should_group_adjacent_elements(self):
+        example_stream = stream(1, 1, 2, 1, 1, 1)
+
+        groups = example_stream.group_adjacent(lambda x: x, collectors.counting())
+
+        assert groups.to_list() == [(1, 2), (2, 1), (1, 3)]
+        empty: Stream[int] = stream()
+        assert empty.group_adjacent(lambda x: x).to_list() == []
+
+    def test_it_should_sort_elements_in_memory(self):
+        assert stream(3, 1, 2).sorted().to_list() == [1, 2, 3]
+        assert stream("bb", "a", "ccc").sorted(key=len, reverse=True).to_list() == [
+            "ccc",
+            "bb",
+            "a",
+        ]
+
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_it_should_sort_elements_spilling_runs_to_disk(self, tmp_path, reverse):
+        numbers = [(n * 7919) % 1000 for n in range(1000)]
+
+        result = stream_of(numbers).sorted(
+            reverse=reverse,
+            memory_limit=64,
+            spill_dir=str(tmp_path),
+        )
+
+        assert result.to_list() == sorted(numbers, reverse=reverse)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_external_sort_should_be_stable(self):
+        pairs = [(n % 3, n) for n in range(30)]
+
+        result = stream_of(pairs).sorted(key=lambda pair: pair[0], memory_limit=4)
+
+        assert result.to_list() == sorted(pairs, key=lambda pair: pair[0])
+
+    @pytest.mark.parametrize("size, spills", [(3, 0), (6, 1), (7, 2)])
+    def test_external_sort_should_spill_only_runs_followed_by_more_elements(
+        self,
+        monkeypatch,
+        size,
+        spills,
+    ):
+        created = []
+
+        class CountedSpillFile(_sort.SpillFile):
+            def __init__(self, directory=None):
+                super().__init__(directory)
+                created.append(self)
+
+        monkeypatch.setattr(_sort, "SpillFile", CountedSpillFile)
+
+        result = stream_of(range(size, 0, -1)).sorted(memory_limit=3).to_list()
+
+        assert result == list(range(1, size + 1))
+        assert len(created) == spills
+
+    def test_it_should_remove_duplicated_elements_preserving_order(self):
+        assert stream(3, 1, 3, 2, 1).distinct().to_list() == [3, 1, 2]
+        assert stream("a", "bb", "c", "dd", "eee").distinct(key=len).to_list() == [
+            "a",
+            "bb",
+            "eee",
+        ]
+
+    def test_it_should_remove_duplicated_elements_approximately(self):
+        numbers = list(range(5000)) * 2
+
+        result = (
+            stream_of(numbers)
+            .distinct(approximate=True, capacity=5000, error_rate=0.01)
+            .to_list()
+        )
+
+        assert len(set(result)) == len(result)
+        assert len(result) > 4900
+
+    @pytest.mark.parametrize("elems", [(-1, -2, 5), (2**61 + 4, 5), ("a", b"a")])
+    def test_approximate_distinct_should_keep_elements_with_same_hash(self, elems):
+        result = stream_of(elems).distinct(approximate=True, capacity=100).to_list()
+
+        assert result == list(elems)
+
+    @pytest.mark.parametrize("approximate", [False, True])
+    def test_distinct_should_start_over_on_each_replay(self, approximate):
+        unique = (
+            stream(1, 2, 1, 3).cache().distinct(approximate=approximate, capacity=100)
+        )
+
+        assert unique.to_list() == [1, 2, 3]
+        assert unique.to_list() == [1, 2, 3]
+
+    def test_it_should_inner_join_streams(self):
+        orders = stream((1, "ann"), (2, "bob"), (3, "ann"), (4, "zoe"))
+        customers = stream_of([("ann", "AR"), ("bob", "UY")])
+
+        result = orders.join(
+            customers,
+            lambda order: order[1],
+            lambda customer: customer[0],
+        )
+
+        assert [(order[0], customer[1]) for order, customer in result] == [
+            (1, "AR"),
+            (2, "UY"),
+            (3, "AR"),
+        ]
+
+    def test_it_should_left_join_streams(self):
+        orders = stream((1, "ann"), (2, "zoe"))
+        customers = [("ann", "AR")]
+
+        result = orders.join(
+            customers,
+            lambda order: order[1],
+            lambda customer: customer[0],
+            how="left",
+        )
+
+        assert [
+            (order[0], str(customer.map(lambda c: c[1]))) for order, customer in result
+        ] == [
+            (1, "Just[AR]"),
+            (2, "Nothing"),
+        ]
+
+    def test_it_should_join_spilling_build_side_to_disk(self, tmp_path):
+        left = stream_of(range(100))
+        right = [(n % 50, n) for n in range(200)]
+
+        result = left.join(
+            right,
+            lambda n: n,
+            lambda pair: pair[0],
+            memory_limit=10,
+            partitions=4,
+            spill_dir=str(tmp_path),
+        ).to_list()
+
+        assert sorted(result) == sorted(
+            (n, pair) for n in range(100) for pair in right if pair[0] == n
+        )
+        assert list(tmp_path.iterdir()) == []
+
+    def test_it_should_join_in_memory_up_to_memory_limit(self, monkeypatch):
+        def fail(*args):
+            raise AssertionError("build side should not be spilled")
+
+        monkeypatch.setattr(_join, "_grace_join", fail)
+        right = [(n, str(n)) for n in range(10)]
+
+        result = stream_of(range(10)).join(
+            right,
+            lambda n: n,
+            lambda pair: pair[0],
+            memory_limit=10,
+        )
+
+        assert result.to_list() == list(zip(range(10), right))
+
+    def test_it_should_merge_sorted_streams(self):
+        result = merge_sorted(stream(1, 4, 7), [2, 5, 8], stream_of(range(3, 10, 3)))
+
+        assert result.to_list() == [1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+    def test_it_should_merge_sorted_streams_lazily_by_key(self):
+        result = merge_sorted(
+            stream_of(itertools.count(0, 2)),
+            stream_of(itertools.count(1, 2)),
+            key=lambda n: n,
+        ).take_while(lambda n: n < 6)
+
+        assert result.to_list() == [0, 1, 2, 3, 4, 5]
+
+    def test_cached_stream_should_be_consumed_many_times_evaluating_once(self):
+        calls = []
+
+        def track(x: int) -> int:
+            calls.append(x)
+            return x * 10
+
+        cached = stream_of(range(5)).map(track).cache()
+
+        assert cached.take_while(lambda x: x < 20).to_list() == [0, 10]
+        assert cached.to_list() == [0, 10, 20, 30, 40]
+        assert cached.sum() == 100
+        assert calls == [0, 1, 2, 3, 4]
+
+    def test_cached_stream_should_spill_elements_over_max_items(self, tmp_path):
+        cached = stream_of(range(3000)).cache(max_items=100, spill_dir=str(tmp_path))
+
+        first, second = iter(cached), iter(cached)
+
+        assert [next(first) for _ in range(2500)] == list(range(2500))
+        assert list(second) == list(range(3000))
+        assert list(first) == list(range(2500, 3000))
+
+    def test_it_should_split_stream_in_independent_streams(self):
+        evens, odds = stream_of(range(10)).map(lambda x: x + 1).tee()
+
+        assert evens.filter(lambda n: n % 2 == 0).to_list() == [2, 4, 6, 8, 10]
+        assert odds.filter(lambda n: n % 2 == 1).to_list() == [1, 3, 5, 7, 9]
+
+    def test_profiled_stream_should_record_stats_per_stage(self):
+        def is_even(x: int) -> bool:
+            return x % 2 == 0
+
+        profiled = (
+            stream_of(range(10))
+            .filter(is_even)
+            .profile()
+            .flat_map(lambda x: [x, x])
+            .batched(3)
+        )
+
+        assert profiled.stats.is_empty is True
+        assert profiled.to_list() == [[0, 0, 2], [2, 4, 4], [6, 6, 8], [8]]
+
+        stats = profiled.stats.get_or_raise(AssertionError()).stages
+        assert [(stage.elements_in, stage.elements_out) for stage in stats] == [
+            (10, 5),
+            (5, 10),
+            (10, 4),
+        ]
+        assert stats[0].selectivity == 0.5
+        assert stats[0].description == "filter(is_even)"
+
+    def test_it_should_explain_stream_stages(self):
+        example_stream = stream_of(range(10)).map(str).sorted()
+
+        assert example_stream.explain() == "source: range\n  -> map(str)\n  -> sorted"
+
+        profiled = example_stream.profile()
+        profiled.to_list()
+
+        assert "-> map(str) in=10 out=10 selectivity=100.00%" in profiled.explain()
+
+    def test_it_should_prefetch_elements_in_background(self):
+        example_stream = stream_of(range(100)).map(lambda x: x * 2).prefetch(8)
+
+        assert example_stream.to_list() == [n * 2 for n in range(100)]
+
+    def test_prefetch_should_stop_producer_when_consumer_stops_early(self):
+        closed = []
+
+        def numbers():
+            try:
+                yield from itertools.count()
+            finally:
+                closed.append(True)
+
+        result = stream_of(numbers()).prefetch(4).take_while(lambda x: x < 5).to_list()
+
+        assert result == [0, 1, 2, 3, 4]
+        assert closed == [True]
+
+    @pytest.mark.parametrize(
+        "consume",
+        [
+            lambda s: s.to_list(),
+            lambda s: list(s),
+            lambda s: s.find_first(lambda x: x > 2),
+            lambda s: s.any_match(lambda x: x > 2),
+        ],
+    )
+    def test_prefetch_should_stop_producer_while_stream_is_referenced(self, consume):
+        closed = []
+
+        def numbers():
+            try:
+                yield from itertools.count()
+            finally:
+                closed.append(True)
+
+        example_stream = stream_of(numbers()).prefetch(4).take_while(lambda x: x < 5)
+
+        consume(example_stream)
+
+        assert closed == [True]
+        assert "pynction-prefetch" not in {
+            thread.name for thread in threading.enumerate()
+        }
+
+    def test_prefetch_should_propagate_upstream_errors(self):
+        def explode(x: int) -> int:
+            if x == 3:
+                raise ValueError("Boom!")
+            return x
+
+        with pytest.raises(ValueError, match="Boom!"):
+            stream_of(range(10)).map(explode).prefetch(2).to_list()
+
+    @pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+    def test_prefetch_should_fail_when_producer_dies(self):
+        class Halt(BaseException):
+            pass
+
+        def numbers():
+            yield 1
+            raise Halt()
+
+        with pytest.raises(RuntimeError, match="producer stopped"):
+            stream_of(numbers()).prefetch(2).to_list()
+
+    def test_it_should_reduce_by_key_in_parallel(self):
+        numbers = range(1000)
+
+        result = stream_of(numbers).par_reduce(
+            last_digit,
+            square,
+            operator.add,
+            workers=2,
+            chunksize=64,
+        )
+
+        expected = {
+            digit: sum(n * n for n in numbers if n % 10 == digit) for digit in range(10)
+        }
+        assert result == expected
+
+    def test_it_should_reduce_empty_stream_in_parallel(self):
+        assert stream().par_reduce(last_digit, square, operator.add, workers=2) == {}
+
+    @pytest.mark.parametrize(
+        "workers, chunksize, message",
+        [(0, 10, "workers"), (2, 0, "chunksize")],
+    )
+    def test_par_reduce_should_reject_invalid_sizes(self, workers, chunksize, message):
+        with pytest.raises(ValueError, match=f"{message} must be greater than 0"):
+            stream(1, 2, 3).par_reduce(
+                last_digit,
+                square,
+                operator.add,
+                workers=workers,
+                chunksize=chunksize,
+            )
+
+    @pytest.mark.parametrize(
+        "source",
+        [range(10), list(range(10)), tuple(range(10)), iter(range(10))],
+    )
+    def test_it_should_skip_first_elements(self, source):
+        assert stream_of(source).skip(7).to_list() == [7, 8, 9]
+
+    def test_it_should_skip_elements_of_huge_range_without_iterating(self):
+        assert stream_of(range(10**18)).skip(10**18 - 2).to_list() == [
+            10**18 - 2,
+            10**18 - 1,
+        ]
+
+    def test_it_should_skip_elements_after_other_operations(self):
+        assert stream_of(range(10)).map(lambda x: x * 2).skip(8).to_list() == [16, 18]
+
+    def test_it_should_limit_elements_without_consuming_the_rest(self):
+        numbers = iter(range(10))
+
+        assert stream_of(numbers).limit(3).to_list() == [0, 1, 2]
+        assert next(numbers) == 3
+        assert stream_of(itertools.count()).take(2).to_list() == [0, 1]
+
+    def test_it_should_drop_elements_while_condition_is_satisfied(self):
+        assert stream(1, 2, 3, 1).drop_while(lambda x: x < 3).to_list() == [3, 1]
+
+    @pytest.mark.parametrize(
+        "file_name, opener",
+        [("numbers.txt", open), ("numbers.txt.gz", gzip.open)],
+    )
+    def test_it_should_write_elements_to_file(self, tmp_path, file_name, opener):
+        path = tmp_path / file_name
+
+        written = stream("a", b"b", 3).to_file(path, buffer_size=2)
+
+        assert written == 3
+        with opener(path, "rb") as file:
+            assert file.read() == b"a\nb\n3\n"
+
+    def test_it_should_write_elements_as_json_lines(self, tmp_path):
+        path = tmp_path / "records.jsonl"
+
+        written = stream({"id": 1, "name": "Ñandú"}, [1, 2]).to_jsonl(path)
+
+        assert written == 2
+        assert [
+            json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()
+        ] == [
+            {"id": 1, "name": "Ñandú"},
+            [1, 2],
+        ]
+
+    def test_it_should_write_elements_as_csv_rows(self, tmp_path):
+        rows_path, dicts_path = tmp_path / "rows.csv", tmp_path / "dicts.csv.gz"
+
+        assert stream((1, "a"), (2, "b")).to_csv(rows_path, header=["id", "name"]) == 2
+        assert stream({"id": 1, "name": "a"}).to_csv(dicts_path) == 1
+
+        assert rows_path.read_bytes() == b"id,name\r\n1,a\r\n2,b\r\n"
+        with gzip.open(dicts_path, "rb") as file:
+            assert file.read() == b"id,name\r\n1,a\r\n"
+
+    def test_it_should_close_file_when_previous_operation_raises(self, tmp_path):
+        path = tmp_path / "numbers.txt"
+
+        def explode(x: int) -> int:
+            if x == 2:
+                raise ValueError("Boom!")
+            return x
+
+        with pytest.raises(ValueError):
+            stream_of(range(5)).map(explode).to_file(path)
+
+        assert path.read_text() == "0\n1\n"
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_it_should_parse_json_lines_file_in_chunks(self, tmp_path, workers):
+        path = tmp_path / "records.jsonl"
+        records = [{"id": n, "name": f"name {n}"} for n in range(200)]
+        path.write_text("\n".join(json.dumps(record) for record in records) + "\n")
+
+        result = Stream.from_jsonl(path, workers=workers, chunk_bytes=256).to_list()
+
+        assert result == records
+
+    def test_it_should_read_json_lines_written_by_to_jsonl(self, tmp_path):
+        path = tmp_path / "records.jsonl"
+        records = [{"text": "a\u2028b\u2029c\x85d"}, {"text": "Ñandú"}]
+
+        stream_of(records).to_jsonl(path)
+
+        assert Stream.from_jsonl(path).to_list() == records
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_it_should_parse_csv_file_in_chunks(self, tmp_path, workers):
+        path = tmp_path / "people.csv"
+        path.write_text("id;name\n" + "".join(f"{n};name {n}\n" for n in range(100)))
+
+        rows = Stream.from_csv(
+            path,
+            workers=workers,
+            chunk_bytes=64,
+            delimiter=";",
+        ).to_list()
+        raw_rows = Stream.from_csv(
+            path,
+            has_header=False,
+            workers=workers,
+            chunk_bytes=64,
+            delimiter=";",
+        ).to_list()
+
+        assert rows == [{"id": str(n), "name": f"name {n}"} for n in range(100)]
+        assert raw_rows == [["id", "name"]] + [
+            [str(n), f"name {n}"] for n in range(100)
+        ]
+
+    @pytest.mark.parametrize(
+        "file_name, opener",
+        [
+            ("log.gz", gzip.open),
+            ("log.bz2", bz2.open),
+            ("log.xz", lzma.open),
+            ("log.data", gzip.open),
+        ],
+    )
+    def test_it_should_read_lines_from_compressed_file(
+        self,
+        tmp_path,
+        file_name,
+        opener,
+    ):
+        path = tmp_path / file_name
+        with opener(path, "wb") as file:
+            file.write("".join(f"línea {n}\n" for n in range(1000)).encode("utf-8"))
+
+        lines = Stream.from_compressed(path, read_size=100, encoding="utf-8").to_list()
+
+        assert lines == [f"línea {n}" for n in range(1000)]
+
+    @pytest.mark.parametrize("prefetch", [0, 2])
+    def test_it_should_read_blocks_from_compressed_file(self, tmp_path, prefetch):
+        path = tmp_path / "data.gz"
+        with gzip.open(path, "wb") as file:
+            file.write(bytes(range(256)) * 10)
+
+        blocks = Stream.from_compressed(
+            path,
+            mode="bytes",
+            read_size=1000,
+            prefetch=prefetch,
+        ).map(bytes)
+
+        assert b"".join(blocks) == bytes(range(256)) * 10
+
+    def test_it_should_read_uncompressed_file(self, tmp_path):
+        path = tmp_path / "plain.txt"
+        path.write_bytes(b"a\nb")
+
+        assert Stream.from_compressed(path).map(bytes).to_list() == [b"a", b"b"]
+
+    def test_it_should_unpack_records_from_buffer(self):
+        buffer = b"".join(struct.pack("<ih", n, -n) for n in range(10))
+
+        records = Stream.from_records(buffer, "<ih", block_records=3).to_list()
+
+        assert records == [(n, -n) for n in range(10)]
+
+    def test_it_should_unpack_named_records_from_file(self, tmp_path):
+        frame = collections.namedtuple("frame", ["timestamp", "value"])
+        path = tmp_path / "telemetry.bin"
+        path.write_bytes(b"".join(struct.pack("<qd", n, n / 2) for n in range(100)))
+
+        frames = Stream.from_records(path, "<qd", frame, block_records=7).to_list()
+
+        assert frames == [frame(n, n / 2) for n in range(100)]
+
+    def test_it_should_fail_when_buffer_has_incomplete_records(self):
+        with pytest.raises(ValueError, match="not a multiple of the record size 4"):
+            Stream.from_records(b"\x00" * 6, "<i").to_list()
+
+    def test_it_should_read_length_prefixed_frames_from_socket(self):
+        reader, writer = socket.socketpair()
+        messages = [b"", b"a", b"x" * 100, b"hello"]
+        with reader, writer:
+            writer.sendall(
+                b"".join(
+                    struct.pack("!I", len(message)) + message for message in messages
+                ),
+            )
+            writer.shutdown(socket.SHUT_WR)
+
+            frames = Stream.from_socket(reader, buffer_size=16).map(bytes).to_list()
+
+        assert frames == messages
+
+    def test_it_should_read_newline_delimited_frames_from_socket(self):
+        reader, writer = socket.socketpair()
+        with reader, writer:
+            writer.sendall(b"first\n" + b"y" * 40 + b"\n\nlast")
+            writer.shutdown(socket.SHUT_WR)
+
+            frames = (
+                Stream.from_socket(reader, framing="newline", buffer_size=8)
+                .map(bytes)
+                .to_list()
+            )
+
+        assert frames == [b"first", b"y" * 40, b"", b"last"]
+
+    def test_it_should_fail_when_newline_frame_exceeds_max_frame_size(self):
+        reader, writer = socket.socketpair()
+        with reader, writer:
+            writer.sendall(b"ok\n" + b"z" * 100)
+
+            frames = Stream.from_socket(
+                reader,
+                framing="newline",
+                buffer_size=8,
+                max_frame_size=32,
+            )
+
+            with pytest.raises(ValueError, match="exceeds max_frame_size 32"):
+                frames.map(bytes).to_list()
+
+    def test_it_should_fail_when_socket_closes_with_incomplete_frame(self):
+        reader, writer = socket.socketpair()
+        with reader, writer:
+            writer.sendall(struct.pack("!I", 10) + b"abc")
+            writer.shutdown(socket.SHUT_WR)
+
+            with pytest.raises(ConnectionError, match="incomplete frame"):
+                Stream.from_socket(reader).to_list()